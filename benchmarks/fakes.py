@@ -0,0 +1,229 @@
+"""
+Offline stand-ins for the Apify actors: deterministic datasets shaped like the
+actors output, served by a client exposing the subset of ApifyClient used by the scraper.
+"""
+
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+WORDS = (
+    "election vote campaign city market music festival football match coach team fans price fuel road school "
+    "health hospital rain flood harvest startup funding concert album award"
+).split()
+POSITIVE = "great love amazing happy win proud excellent best".split()
+NEGATIVE = "bad hate terrible sad lose angry worst broken".split()
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def sentence(rng: random.Random, words: int = 20) -> str:
+    vocabulary = WORDS * 3 + POSITIVE + NEGATIVE
+    return " ".join(rng.choice(vocabulary) for _ in range(words)) + f" #{rng.choice(WORDS)}"
+
+
+def _date(rng: random.Random) -> datetime:
+    return EPOCH + timedelta(minutes=rng.randrange(60 * 24 * 90))
+
+
+def _counts(rng: random.Random) -> Dict[str, int]:
+    return {"likes": rng.randrange(10_000), "shares": rng.randrange(1_000), "views": rng.randrange(100_000)}
+
+
+def _facebook(rng: random.Random, index: int) -> Dict[str, Any]:
+    counts = _counts(rng)
+    return {
+        "id": f"fb-{index}",
+        "postId": str(10**15 + index),
+        "feedbackId": f"feedback-{index}",
+        "user": {"id": str(rng.randrange(10**9)), "name": f"user {index % 97}"},
+        "text": sentence(rng),
+        "url": f"https://www.facebook.com/posts/{index}",
+        "date": _date(rng).isoformat(),
+        "time": _date(rng).isoformat(),
+        "hashtag": rng.choice(WORDS),
+        "likesCount": counts["likes"],
+        "sharesCount": counts["shares"],
+        "viewsCount": counts["views"],
+        "commentsCount": rng.randrange(500),
+    }
+
+
+def _tiktok(rng: random.Random, index: int) -> Dict[str, Any]:
+    counts = _counts(rng)
+    return {
+        "id": str(7 * 10**18 + index),
+        "text": sentence(rng),
+        "createTime": int(_date(rng).timestamp()),
+        "authorMeta": {"id": str(rng.randrange(10**9)), "name": f"creator{index % 53}"},
+        "webVideoUrl": f"https://www.tiktok.com/@creator/video/{index}",
+        "diggCount": counts["likes"],
+        "shareCount": counts["shares"],
+        "playCount": counts["views"],
+        "commentCount": rng.randrange(500),
+        "hashtags": [{"name": rng.choice(WORDS)} for _ in range(3)],
+    }
+
+
+def _twitter(rng: random.Random, index: int) -> Dict[str, Any]:
+    counts = _counts(rng)
+    return {
+        "id_str": str(17 * 10**17 + index),
+        "full_text": sentence(rng, 12),
+        "created_at": _date(rng).strftime("%a %b %d %H:%M:%S %z %Y"),
+        "user": {"screen_name": f"handle{index % 71}", "id_str": str(rng.randrange(10**9))},
+        "url": f"https://x.com/handle/status/{index}",
+        "favorite_count": counts["likes"],
+        "retweet_count": counts["shares"],
+        "view_count": counts["views"],
+        "reply_count": rng.randrange(200),
+        "entities": {"hashtags": [{"text": rng.choice(WORDS)}]},
+    }
+
+
+def _instagram_post(rng: random.Random, index: int) -> Dict[str, Any]:
+    return {
+        "id": str(3 * 10**18 + index),
+        "caption": sentence(rng),
+        "timestamp": _date(rng).isoformat(),
+        "ownerUsername": f"insta{index % 41}",
+        "url": f"https://www.instagram.com/p/{index}",
+        "likesCount": rng.randrange(10_000),
+        "videoViewCount": rng.randrange(100_000),
+        "commentsCount": rng.randrange(500),
+        "hashtags": [rng.choice(WORDS) for _ in range(3)],
+    }
+
+
+def _youtube(rng: random.Random, index: int) -> Dict[str, Any]:
+    counts = _counts(rng)
+    return {
+        "id": f"yt{index:09d}",
+        "title": sentence(rng, 8),
+        "text": sentence(rng),
+        "date": _date(rng).isoformat(),
+        "channelName": f"channel {index % 29}",
+        "url": f"https://www.youtube.com/watch?v={index}",
+        "likes": counts["likes"],
+        "viewCount": counts["views"],
+        "commentsCount": rng.randrange(500),
+        "hashtags": [f"#{rng.choice(WORDS)}"],
+    }
+
+
+def _google_result(rng: random.Random, index: int) -> Dict[str, Any]:
+    return {
+        "url": f"https://news.example.com/{index}",
+        "displayedUrl": "news.example.com",
+        "title": sentence(rng, 8),
+        "description": sentence(rng),
+        "date": _date(rng).isoformat(),
+    }
+
+
+ITEMS: Dict[str, Callable[[random.Random, int], Dict[str, Any]]] = {
+    "facebook": _facebook,
+    "tiktok": _tiktok,
+    "twitter": _twitter,
+    "youtube": _youtube,
+}
+
+
+def dataset(platform: str, size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Deterministic actor output of `size` posts for a platform.
+    """
+
+    rng = random.Random(f"{platform}-{seed}")
+    if platform == "instagram":
+        half = size // 2
+        return [
+            {
+                "topPosts": [_instagram_post(rng, index) for index in range(half)],
+                "latestPosts": [_instagram_post(rng, index) for index in range(half, size)],
+            }
+        ]
+    if platform == "google":
+        return [
+            {
+                "organicResults": [_google_result(rng, index) for index in range(size)],
+                "relatedQueries": [{"title": rng.choice(WORDS), "url": None} for _ in range(5)],
+            }
+        ]
+    return [ITEMS[platform](rng, index) for index in range(size)]
+
+
+class _Result:
+    def __init__(self, items: List[Dict[str, Any]]):
+        self.items = items
+
+
+class FakeApifyClient:
+    """
+    Serves generated datasets for the actor runs of the scraper. `latency` simulates the actor run duration.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.runs: Dict[str, Dict[str, Any]] = {}
+        self.datasets: Dict[str, List[Dict[str, Any]]] = {}
+
+    def actor(self, platform: str) -> "FakeApifyClient._Actor":
+        return self._Actor(self, platform)
+
+    def run(self, run_id: str) -> "FakeApifyClient._Run":
+        return self._Run(self, run_id)
+
+    def dataset(self, dataset_id: str) -> "FakeApifyClient._Dataset":
+        return self._Dataset(self, dataset_id)
+
+    class _Actor:
+        def __init__(self, client: "FakeApifyClient", platform: str):
+            self.client, self.platform = client, platform
+
+        def start(self, run_input: Dict[str, Any]) -> Dict[str, Any]:
+            size = next(
+                (
+                    run_input[key]
+                    for key in ("resultsLimit", "resultsPerPage", "tweetsDesired", "maxResults")
+                    if run_input.get(key)
+                ),
+                20,
+            )
+            run_id, dataset_id = uuid.uuid4().hex, uuid.uuid4().hex
+            self.client.datasets[dataset_id] = dataset(self.platform, size)
+            self.client.runs[run_id] = {"id": run_id, "status": "READY", "defaultDatasetId": dataset_id}
+            return self.client.runs[run_id]
+
+    class _Run:
+        def __init__(self, client: "FakeApifyClient", run_id: str):
+            self.client, self.run_id = client, run_id
+
+        def wait_for_finish(self) -> Dict[str, Any]:
+            if self.client.latency:
+                # The real client blocks the same way
+                time.sleep(self.client.latency)
+            return {**self.client.runs.pop(self.run_id), "status": "SUCCEEDED"}
+
+    class _Dataset:
+        def __init__(self, client: "FakeApifyClient", dataset_id: str):
+            self.client, self.dataset_id = client, dataset_id
+
+        def list_items(self) -> _Result:
+            return _Result(self.client.datasets.pop(self.dataset_id))
+
+
+def install_fake_apify(latency: float = 0.0) -> FakeApifyClient:
+    """
+    Point the shared scraper at a fake Apify backend.
+    """
+
+    from src.shared.scrapper import ACTOR_SETTINGS, get_scraper
+
+    scraper = get_scraper()
+    scraper.client = FakeApifyClient(latency=latency)
+    # Handles are keyed by platform, whatever actor ids are configured
+    scraper.actors = {platform: scraper.client.actor(platform) for platform in ACTOR_SETTINGS}
+    return scraper.client
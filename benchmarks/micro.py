@@ -0,0 +1,110 @@
+"""
+Micro-benchmarks of the CPU bound hot paths of the collectors: sentiment scoring,
+post normalization, statistics aggregation, dataset flattening and
+batch validation of the platform items.
+
+    python -m benchmarks.micro [--size 1000] [--repeat 7] [--output micro.json] [suite ...]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from .fakes import dataset, sentence
+from .report import write_report
+
+PLATFORMS = ["facebook", "tiktok", "twitter", "instagram", "google", "youtube"]
+
+
+def measure(name: str, func: Callable[[], Any], items: int, repeat: int) -> Dict[str, Any]:
+    func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return {
+        "case": name,
+        "items": items,
+        "repeat": repeat,
+        "best_ms": round(best * 1000, 3),
+        "median_ms": round(sorted(timings)[len(timings) // 2] * 1000, 3),
+        "items_per_s": round(items / best, 1),
+    }
+
+
+def sentiment_cases(size: int) -> Dict[str, Callable[[], Any]]:
+    from src.shared.utils import get_analyzer
+
+    rng = random.Random("sentiment")
+    texts = [sentence(rng) for _ in range(size)]
+    analyzer = get_analyzer()
+    return {"sentiment.vader": lambda: [analyzer.polarity_scores(text) for text in texts]}
+
+
+def statistics_cases(size: int) -> Dict[str, Callable[[], Any]]:
+    from src.shared.posts import normalize
+    from src.shared.utils import compute_statistic
+
+    cases = {}
+    for platform in PLATFORMS:
+        items = dataset(platform, size)
+        posts = normalize(platform, items)
+        cases[f"normalize.{platform}"] = lambda platform=platform, items=items: normalize(platform, items)
+        cases[f"statistics.{platform}"] = lambda posts=posts: compute_statistic(posts)
+    return cases
+
+
+def split_cases(size: int) -> Dict[str, Callable[[], Any]]:
+    from src.services.routers.google.api import split_data as google_split
+    from src.shared.posts import flatten
+
+    google, instagram = dataset("google", size), dataset("instagram", size)
+    # One loop for every run, so its setup and teardown stay out of the timings
+    loop = asyncio.new_event_loop()
+    return {
+        "split_data.google": lambda: loop.run_until_complete(google_split(google)),
+        "flatten.instagram": lambda: flatten("instagram", instagram),
+    }
+
+
+def validation_cases(size: int) -> Dict[str, Callable[[], Any]]:
+    from src.shared.validation import validators
+
+    return {
+        f"validation.{platform}": lambda validator=validator, items=dataset(platform, size): validator.clean(items)
+        for platform, validator in validators.items()
+    }
+
+
+SUITES = {
+    "sentiment": sentiment_cases,
+    "statistics": statistics_cases,
+    "split": split_cases,
+    "validation": validation_cases,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("suites", nargs="*", default=list(SUITES), help=f"Among {', '.join(SUITES)}")
+    parser.add_argument("--size", type=int, default=1000, help="Posts per case")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+    if unknown := set(args.suites) - set(SUITES):
+        parser.error(f"Unknown suites: {', '.join(sorted(unknown))}")
+
+    results: List[Dict[str, Any]] = []
+    for suite in args.suites:
+        for name, func in SUITES[suite](args.size).items():
+            results.append(measure(name, func, args.size, args.repeat))
+    write_report(results, args.output, size=args.size, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
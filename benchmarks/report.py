@@ -0,0 +1,50 @@
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _revision() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def latency_summary(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Percentiles of latency samples given in seconds, reported in milliseconds.
+    """
+
+    ordered = sorted(samples)
+    percentiles = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else ordered * 99
+    return {
+        "min_ms": round(ordered[0] * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(percentiles[49] * 1000, 3),
+        "p90_ms": round(percentiles[89] * 1000, 3),
+        "p99_ms": round(percentiles[98] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def write_report(results: List[Dict[str, Any]], output: Optional[Path] = None, **meta):
+    report = json.dumps(
+        {
+            "python": sys.version.split()[0],
+            "machine": platform.machine(),
+            "revision": _revision(),
+            **meta,
+            "results": results,
+        },
+        indent=2,
+    )
+    if output:
+        output.write_text(report)
+    print(report)
@@ -0,0 +1,126 @@
+"""
+End-to-end router benchmark: serve each platform app in process against a fake
+Apify backend and the MongoDB of MONGODB_URI / MONGO_DB (use a dedicated database),
+and report throughput and latency percentiles of its search and statistics routes.
+
+    python -m benchmarks.routers [--requests 200] [--concurrency 10] [--size 50]
+                                 [--actor-latency 0] [--output routers.json] [platform ...]
+
+Background tasks (sentiment storage, post ingestion) run before the ASGI call
+returns, so they are included in the latencies.
+"""
+
+import argparse
+import asyncio
+import importlib
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+from .fakes import install_fake_apify
+from .report import latency_summary, write_report
+
+PLATFORMS = ["facebook", "tiktok", "twitter", "instagram", "google", "youtube"]
+
+KEYWORD = "benchmark"
+USER_INFO = {"active": True, "user_info": {"_id": "benchmark-user"}}
+
+
+def _bypass_auth(app):
+    """
+    Serve the benchmark user without calling the auth service.
+    """
+
+    from src.shared.auth_handler import CheckPermissions
+
+    def walk(dependant):
+        for dependency in dependant.dependencies:
+            if isinstance(dependency.call, CheckPermissions):
+                app.dependency_overrides[dependency.call] = lambda: USER_INFO
+            walk(dependency)
+
+    for route in app.routes:
+        if (dependant := getattr(route, "dependant", None)) is not None:
+            walk(dependant)
+
+
+async def _seed_project():
+    from src.shared.projects import create_projects
+
+    # Already created by a previous run otherwise
+    await create_projects([KEYWORD], USER_INFO["user_info"])
+
+
+def _routes(app, size: int) -> Dict[str, str]:
+    prefix = next(route.path for route in app.routes if route.path.endswith("/@ping"))[: -len("/@ping")]
+    paths = {route.path for route in app.routes}
+    routes = {"search": f"{prefix}?keyword={KEYWORD}&size={size}"}
+    if f"{prefix}/{{keyword}}/statistics" in paths:
+        routes["statistics"] = f"{prefix}/{KEYWORD}/statistics?size={size}"
+    return routes
+
+
+async def _load(client: httpx.AsyncClient, url: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    queue = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in queue:
+            started = time.perf_counter()
+            response = await client.get(url)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"requests": requests, "errors": errors, "rps": round(requests / elapsed, 1), **latency_summary(latencies)}
+
+
+async def bench_platform(platform: str, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    app = importlib.import_module(f"src.services.routers.{platform}").app
+    _bypass_auth(app)
+
+    results = []
+    async with app.router.lifespan_context(app):
+        install_fake_apify(latency=args.actor_latency)
+        await _seed_project()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for name, url in _routes(app, args.size).items():
+                # Warm up caches, lazy imports and the analyses of the generated posts
+                await _load(client, url, requests=min(args.concurrency, args.requests), concurrency=1)
+                stats = await _load(client, url, args.requests, args.concurrency)
+                results.append({"platform": platform, "route": name, **stats})
+    return results
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    results = []
+    for platform in args.platforms:
+        results.extend(await bench_platform(platform, args))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("platforms", nargs="*", default=PLATFORMS)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--size", type=int, default=50, help="Items returned by each actor run")
+    parser.add_argument("--actor-latency", type=float, default=0.0, help="Simulated actor run duration, in seconds")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    write_report(results, args.output, requests=args.requests, concurrency=args.concurrency, size=args.size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Cold start benchmark: import every service app in fresh interpreters and report
+import time, process wall time, peak memory and which heavy libraries got loaded.
+
+    python -m benchmarks.startup [--runs 5] [--output startup.json] [service ...]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .report import ROOT, write_report
+
+SERVICES = [
+    "project",
+    "facebook",
+    "tiktok",
+    "twitter",
+    "instagram",
+    "google",
+    "youtube",
+    "analyse",
+    "cloudtags",
+    "rapport",
+    "all",
+]
+
+HEAVY_MODULES = [
+    "apify_client",
+    "newsapi",
+    "vaderSentiment",
+    "wordcloud",
+    "matplotlib",
+    "weasyprint",
+    "numpy",
+    "jwt",
+]
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import src.services.routers.{service} as service
+service.app.openapi()
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "import_ms": elapsed * 1000,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "heavy_modules": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def probe(service: str) -> dict:
+    code = PROBE.format(service=service, heavy=HEAVY_MODULES)
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    return {**json.loads(result.stdout.strip().splitlines()[-1]), "wall_ms": wall_ms}
+
+
+def measure(service: str, runs: int) -> dict:
+    samples = [probe(service) for _ in range(runs)]
+    return {
+        "service": service,
+        "runs": runs,
+        "import_ms": round(statistics.median(s["import_ms"] for s in samples), 1),
+        "wall_ms": round(statistics.median(s["wall_ms"] for s in samples), 1),
+        "max_rss_mb": round(max(s["max_rss_kb"] for s in samples) / 1024, 1),
+        "heavy_modules": samples[-1]["heavy_modules"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("services", nargs="*", default=SERVICES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    write_report([measure(service, args.runs) for service in args.services], args.output)
+
+
+if __name__ == "__main__":
+    main()
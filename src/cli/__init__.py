@@ -1,10 +1,11 @@
 import typer
 
-from src.cli import config, service
+from src.cli import config, db, service
 
 app = typer.Typer(pretty_exceptions_show_locals=False)
 app.add_typer(service.app, name="service")
 app.add_typer(config.app, name="config")
+app.add_typer(db.app, name="db")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+import asyncio
+import fnmatch
+from typing import Any, Dict, Iterator, List, Set
+
+import typer
+from beanie import init_beanie
+
+from src.common.helpers.mongodb import mongodb_client
+from src.services import models
+from src.services.config.base import settings
+from src.services.models.queries import AuditQuery, registry
+from src.shared import projects
+
+app = typer.Typer()
+
+# Plan stages that read every document or sort in memory
+COLLSCAN = "COLLSCAN"
+BLOCKING_SORT = "SORT"
+
+
+async def connect(allow_index_dropping: bool = False):
+    client = await mongodb_client(settings.MONGODB_URI)
+    await init_beanie(
+        database=client[settings.MONGO_DB],
+        document_models=models.document_models,
+        allow_index_dropping=allow_index_dropping,
+    )
+    return client
+
+
+def _winning_plans(node: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "winningPlan":
+                yield value
+            else:
+                yield from _winning_plans(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _winning_plans(item)
+
+
+def _stages(node: Any) -> Iterator[str]:
+    if isinstance(node, dict):
+        if "stage" in node:
+            yield node["stage"]
+        for value in node.values():
+            yield from _stages(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _stages(item)
+
+
+async def explain(query: AuditQuery) -> Set[str]:
+    collection = query.model.get_motor_collection()
+    if query.pipeline is not None:
+        plan = await collection.database.command("aggregate", collection.name, pipeline=query.pipeline, explain=True)
+    else:
+        plan = await collection.find(query.filter or {}, sort=query.sort).explain()
+    return {stage for winning_plan in _winning_plans(plan) for stage in _stages(winning_plan)}
+
+
+@app.command("sync-indexes")
+def sync_indexes(
+    drop: bool = typer.Option(False, help="Drop indexes that are no longer declared on the models"),
+):
+    """
+    Create the indexes declared by every model.
+    """
+
+    async def run() -> Dict[str, List[str]]:
+        client = await connect(allow_index_dropping=drop)
+        try:
+            return {
+                model.get_collection_name(): sorted(await model.get_motor_collection().index_information())
+                for model in models.document_models
+            }
+        finally:
+            client.close()
+
+    for collection, indexes in asyncio.run(run()).items():
+        typer.echo(f"{collection}: {', '.join(indexes)}")
+
+
+@app.command("explain")
+def explain_queries(
+    pattern: str = typer.Option("*", "--name", help="Only explain the queries matching this glob"),
+    strict: bool = typer.Option(False, help="Also fail on in-memory sorts"),
+):
+    """
+    Explain the registered service queries and fail when one of them scans a whole collection.
+    """
+
+    async def run() -> Dict[str, Set[str]]:
+        client = await connect()
+        try:
+            return {query.name: await explain(query) for query in registry() if fnmatch.fnmatch(query.name, pattern)}
+        finally:
+            client.close()
+
+    failed = []
+    for name, stages in asyncio.run(run()).items():
+        problems = {COLLSCAN} & stages
+        if strict:
+            problems |= {BLOCKING_SORT} & stages
+        if problems:
+            failed.append(name)
+        status = typer.style("FAIL", fg=typer.colors.RED) if problems else typer.style("ok", fg=typer.colors.GREEN)
+        typer.echo(f"{status:<4} {name:<32} {' > '.join(sorted(stages))}")
+
+    if failed:
+        typer.echo(f"{len(failed)} queries without a supporting index: {', '.join(failed)}", err=True)
+        raise typer.Exit(code=1)
+
+
+@app.command("backfill-search-terms")
+def backfill_search_terms():
+    """
+    Compute the autocomplete terms of existing projects.
+    """
+
+    async def run() -> int:
+        client = await connect()
+        try:
+            return await projects.backfill_search_terms()
+        finally:
+            client.close()
+
+    typer.echo(f"{asyncio.run(run())} projects updated")
+
+
+if __name__ == "__main__":
+    app()
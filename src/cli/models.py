@@ -12,3 +12,9 @@ class ServiceName(str, Enum):
     facebook = "facebook"
     instagram = "instagram"
     cloudtags = "cloudtags"
+    all = "all"
+
+
+class RuntimeProfile(str, Enum):
+    dev = "dev"
+    prod = "prod"
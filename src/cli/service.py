@@ -20,19 +20,19 @@ def run(
     service: models.ServiceName = typer.Argument(...),
     port: int = typer.Option(None),
     host: str = typer.Option("0.0.0.0"),
-    workers: int = typer.Option(1),
+    workers: int = typer.Option(None, help="Number of workers, defaults to the available cores with the prod profile"),
+    profile: models.RuntimeProfile = typer.Option(None, help="Runtime profile, defaults to APP_ENV"),
 ):
     config = service_config.get(service.value)
     config.API_PORT = port or config.API_PORT
     config.API_IP_ADDRESS = host or config.API_IP_ADDRESS
-    config.UVICORN_WORKERS = workers or config.UVICORN_WORKERS
 
     logger = get_logger("cli.service", level="debug")
     logger.debug(f"Starting {service.name}")
     logger.debug(f"Config {service.value}")
     logger.debug(f"Config {config}")
 
-    start_service(service.value, config)
+    start_service(service.value, config, profile=profile and profile.value, workers=workers)
 
 
 if __name__ == "__main__":
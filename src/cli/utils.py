@@ -1,23 +1,140 @@
+import importlib.util
+import logging
+import os
+from typing import Any, Dict, Optional
+
 import uvicorn
 
 from src.services.config import APIBaseSettings
 
+logger = logging.getLogger(__name__)
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
 
-def start_service(name: str, settings: APIBaseSettings, reload: bool = True):
+def default_profile(settings: APIBaseSettings) -> str:
     match settings.APP_ENV.lower():
         case "dev" | "development":
-            reload = True
+            return "dev"
         case "prod" | "production":
-            reload = False
+            return "prod"
         case _:
             raise Exception(f"Invalid environment: {settings.APP_ENV}")
 
+
+def production_options(settings: APIBaseSettings, workers: Optional[int] = None) -> Dict[str, Any]:
+    # An explicit UVICORN_WORKERS still wins over the core count
+    if workers is None and "UVICORN_WORKERS" in settings.model_fields_set:
+        workers = settings.UVICORN_WORKERS
+
+    return {
+        "host": settings.API_IP_ADDRESS,
+        "port": settings.API_PORT,
+        "workers": workers or available_cores(),
+        "loop": "uvloop" if _installed("uvloop") else "asyncio",
+        "http": "httptools" if _installed("httptools") else "h11",
+        "timeout_keep_alive": settings.UVICORN_KEEP_ALIVE,
+        "backlog": settings.UVICORN_BACKLOG,
+        "timeout_graceful_shutdown": settings.UVICORN_GRACEFUL_TIMEOUT,
+        "limit_concurrency": settings.UVICORN_LIMIT_CONCURRENCY,
+        "limit_max_requests": settings.UVICORN_MAX_REQUESTS,
+        "proxy_headers": True,
+        "access_log": settings.UVICORN_ACCESS_LOG,
+        "reload": False,
+    }
+
+
+def worker_class(options: Dict[str, Any]) -> type:
+    """
+    Uvicorn worker for gunicorn applying the uvicorn options that gunicorn has no setting for.
+    """
+
+    from uvicorn.workers import UvicornWorker
+
+    class ServiceWorker(UvicornWorker):
+        CONFIG_KWARGS = {
+            "loop": options["loop"],
+            "http": options["http"],
+            "limit_concurrency": options["limit_concurrency"],
+            "timeout_graceful_shutdown": options["timeout_graceful_shutdown"],
+            "proxy_headers": options["proxy_headers"],
+            "access_log": options["access_log"],
+        }
+
+    return ServiceWorker
+
+
+def run_preloaded(app_path: str, options: Dict[str, Any]) -> bool:
+    """
+    Serve with gunicorn and uvicorn workers, importing the app once in the master so
+    forked workers share its memory copy-on-write. Returns False when gunicorn is not installed.
+    """
+
+    if not _installed("gunicorn"):
+        return False
+
+    from gunicorn.app.base import BaseApplication
+
+    class PreloadedApplication(BaseApplication):
+        def load_config(self):
+            config = {
+                "bind": f"{options['host']}:{options['port']}",
+                "workers": options["workers"],
+                "worker_class": worker_class(options),
+                "preload_app": True,
+                "keepalive": options["timeout_keep_alive"],
+                "backlog": options["backlog"],
+                "graceful_timeout": options["timeout_graceful_shutdown"],
+                "max_requests": options["limit_max_requests"] or 0,
+                "max_requests_jitter": (options["limit_max_requests"] or 0) // 10,
+                "forwarded_allow_ips": "*",
+                # Uvicorn workers log their requests through the gunicorn access log
+                "accesslog": "-" if options["access_log"] else None,
+            }
+            for key, value in config.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            module, attribute = app_path.split(":")
+            return getattr(importlib.import_module(module), attribute)
+
+    PreloadedApplication().run()
+    return True
+
+
+def start_service(
+    name: str,
+    settings: APIBaseSettings,
+    reload: bool = True,
+    profile: Optional[str] = None,
+    workers: Optional[int] = None,
+):
+    app_path = f"src.services.routers.{name}:app"
+
+    if (profile or default_profile(settings)) == "prod":
+        options = production_options(settings, workers=workers)
+        logger.info(f"Starting {name} with the production profile: {options}")
+        if run_preloaded(app_path, options):
+            return
+        logger.warning("gunicorn is not installed, workers will import the app separately")
+        uvicorn.run(app_path, **options)
+        return
+
     uvicorn.run(
-        f"src.services.routers.{name}:app",
+        app_path,
         **{
             "host": settings.API_IP_ADDRESS,
             "port": settings.API_PORT,
-            "workers": settings.UVICORN_WORKERS,
+            "workers": workers or settings.UVICORN_WORKERS,
             "reload": reload,
         },
     )
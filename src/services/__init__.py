@@ -5,11 +5,16 @@ from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.starlette import StarletteIntegration
 
 from src.services.config.sentry import settings
+from src.shared.profiling import setup_profiling
+from src.shared.responses import ORJSONResponse
+from src.shared.tracing import keep_slow_transactions, traces_sampler
 
 sentry_sdk.init(
     dsn=settings.SENTRY_DSN,
     environment=settings.SENTRY_ENVIRONMENT,
     release=settings.SENTRY_RELEASE,
+    traces_sampler=traces_sampler if settings.tracing_enabled else None,
+    before_send_transaction=keep_slow_transactions,
     integrations=[
         FastApiIntegration(transaction_style="endpoint"),
         StarletteIntegration(transaction_style="endpoint"),
@@ -19,7 +24,9 @@ sentry_sdk.init(
 
 class FastYimbaAPI(FastAPI):
     def __init__(self, *args, **kwargs) -> None:
+        kwargs.setdefault("default_response_class", ORJSONResponse)
         super().__init__(*args, **kwargs)
+        setup_profiling(self)
 
 
 def router_factory(**kwargs) -> APIRouter:
@@ -0,0 +1,34 @@
+from functools import lru_cache
+from typing import List, Literal, Optional
+
+from pydantic import Field, PositiveFloat, PositiveInt
+from pydantic_settings import BaseSettings
+
+
+class AuthSettings(BaseSettings):
+    AUTH_HTTP_TIMEOUT: PositiveFloat = Field(default=5.0, alias="AUTH_HTTP_TIMEOUT")
+    AUTH_HTTP_MAX_CONNECTIONS: PositiveInt = Field(default=100, alias="AUTH_HTTP_MAX_CONNECTIONS")
+    AUTH_HTTP_MAX_KEEPALIVE: PositiveInt = Field(default=20, alias="AUTH_HTTP_MAX_KEEPALIVE")
+    AUTH_CACHE_SIZE: PositiveInt = Field(default=4096, alias="AUTH_CACHE_SIZE")
+    AUTH_CACHE_TTL: PositiveInt = Field(default=60, alias="AUTH_CACHE_TTL")
+    AUTH_PERMISSION_CACHE_TTL: PositiveInt = Field(default=30, alias="AUTH_PERMISSION_CACHE_TTL")
+    AUTH_PERMISSIONS_CLAIM: str = Field(default="permissions", alias="AUTH_PERMISSIONS_CLAIM")
+
+    # LOCAL TOKEN VERIFICATION CONFIG
+    AUTH_VERIFY_MODE: Literal["remote", "local"] = Field(default="remote", alias="AUTH_VERIFY_MODE")
+    AUTH_REMOTE_FALLBACK: bool = Field(default=True, alias="AUTH_REMOTE_FALLBACK")
+    AUTH_JWKS_URL: Optional[str] = Field(default=None, alias="AUTH_JWKS_URL")
+    AUTH_JWKS_REFRESH: PositiveInt = Field(default=300, alias="AUTH_JWKS_REFRESH")
+    AUTH_JWT_ALGORITHMS: List[str] = Field(default=["RS256"], alias="AUTH_JWT_ALGORITHMS")
+    AUTH_JWT_AUDIENCE: Optional[str] = Field(default=None, alias="AUTH_JWT_AUDIENCE")
+    AUTH_JWT_ISSUER: Optional[str] = Field(default=None, alias="AUTH_JWT_ISSUER")
+    AUTH_JWT_LEEWAY: int = Field(default=30, alias="AUTH_JWT_LEEWAY")
+    AUTH_JWT_USERINFO_CLAIM: str = Field(default="user_info", alias="AUTH_JWT_USERINFO_CLAIM")
+
+
+@lru_cache
+def auth_settings() -> AuthSettings:
+    return AuthSettings()
+
+
+settings = auth_settings()
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Optional
 
 from pydantic import Field, PositiveInt
 from pydantic_settings import BaseSettings
@@ -10,6 +11,9 @@ class YimbaBaseSettings(BaseSettings):
     # MODELS NAMES CONFIG
     PROJECT_MODEL_NAME: str = Field(..., alias="PROJECT_MODEL_NAME")
     ANALYSE_MODEL_NAME: str = Field(..., alias="ANALYSE_MODEL_NAME")
+    SKETCH_MODEL_NAME: str = Field("sketches", alias="SKETCH_MODEL_NAME")
+    TERM_MODEL_NAME: str = Field("terms", alias="TERM_MODEL_NAME")
+    REPORT_MODEL_NAME: str = Field("reports", alias="REPORT_MODEL_NAME")
 
     # AUTH ENDPOINT CONFIG
     API_AUTH_URL_BASE: str = Field(..., alias="API_AUTH_URL_BASE")
@@ -25,6 +29,8 @@ class YimbaBaseSettings(BaseSettings):
     MONGO_PORT: PositiveInt = Field(..., alias="MONGO_PORT")
     MONGO_USER: str = Field(..., alias="MONGO_USER")
     MONGO_PASSWORD: str = Field(..., alias="MONGO_PASSWORD")
+    # Commands slower than this are written to the slow query log
+    MONGO_SLOW_COMMAND_MS: PositiveInt = Field(default=100, alias="MONGO_SLOW_COMMAND_MS")
 
 
 class APIBaseSettings(YimbaBaseSettings):
@@ -32,6 +38,14 @@ class APIBaseSettings(YimbaBaseSettings):
     API_IP_ADDRESS: str = Field(default="0.0.0.0", alias="API_IP_ADDRESS")
     UVICORN_WORKERS: PositiveInt = Field(default=2, alias="UVICORN_WORKERS")
 
+    # PRODUCTION RUNTIME CONFIG
+    UVICORN_KEEP_ALIVE: PositiveInt = Field(default=5, alias="UVICORN_KEEP_ALIVE")
+    UVICORN_BACKLOG: PositiveInt = Field(default=2048, alias="UVICORN_BACKLOG")
+    UVICORN_GRACEFUL_TIMEOUT: PositiveInt = Field(default=30, alias="UVICORN_GRACEFUL_TIMEOUT")
+    UVICORN_LIMIT_CONCURRENCY: Optional[PositiveInt] = Field(default=None, alias="UVICORN_LIMIT_CONCURRENCY")
+    UVICORN_MAX_REQUESTS: Optional[PositiveInt] = Field(default=None, alias="UVICORN_MAX_REQUESTS")
+    UVICORN_ACCESS_LOG: bool = Field(default=True, alias="UVICORN_ACCESS_LOG")
+
 
 @lru_cache
 def base_settings() -> APIBaseSettings:
@@ -6,12 +6,14 @@ from beanie import Document, init_beanie
 from src.common.helpers.mongodb import mongodb_client
 from src.services import FastYimbaAPI
 from src.services.config.base import settings
+from src.shared.db_monitoring import register_listener
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(format="%(message)s", level=logging.INFO)
 
 
 async def startup_db_client(app: FastYimbaAPI, document_models: List[Type[Document]]):
+    register_listener()
     client = await mongodb_client(settings.MONGODB_URI)
     app.mongo_db_client = client
     await init_beanie(database=client[settings.MONGO_DB], document_models=document_models)
@@ -0,0 +1,23 @@
+from functools import lru_cache
+from typing import Literal, Optional
+
+from pydantic import Field, PositiveFloat
+from pydantic_settings import BaseSettings
+
+
+class ProfilingSettings(BaseSettings):
+    # Secret enabling the profiler for a request, the middleware is not installed when unset
+    PROFILING_TOKEN: Optional[str] = Field(default=None, alias="PROFILING_TOKEN")
+    PROFILING_INTERVAL: PositiveFloat = Field(default=0.001, alias="PROFILING_INTERVAL")
+    # response: the profile replaces the response body, store: written to PROFILING_DIR
+    PROFILING_OUTPUT: Literal["response", "store"] = Field(default="response", alias="PROFILING_OUTPUT")
+    PROFILING_FORMAT: Literal["html", "speedscope"] = Field(default="html", alias="PROFILING_FORMAT")
+    PROFILING_DIR: str = Field(default="profiles", alias="PROFILING_DIR")
+
+
+@lru_cache
+def profiling_settings() -> ProfilingSettings:
+    return ProfilingSettings()
+
+
+settings = profiling_settings()
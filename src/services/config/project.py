@@ -0,0 +1,23 @@
+from functools import lru_cache
+
+from pydantic import Field, PositiveInt
+from pydantic_settings import BaseSettings
+
+
+class ProjectSettings(BaseSettings):
+    PROJECT_BULK_MAX_ITEMS: PositiveInt = Field(default=10000, alias="PROJECT_BULK_MAX_ITEMS")
+    PROJECT_BULK_BATCH_SIZE: PositiveInt = Field(default=1000, alias="PROJECT_BULK_BATCH_SIZE")
+    PROJECT_CACHE_SIZE: PositiveInt = Field(default=4096, alias="PROJECT_CACHE_SIZE")
+    # Existence checks are cached per worker process and only forgotten by the worker that changed the project:
+    # other workers may keep accepting a deleted project for up to PROJECT_CACHE_TTL seconds, and rejecting a new
+    # one for up to PROJECT_NEGATIVE_CACHE_TTL seconds
+    PROJECT_CACHE_TTL: PositiveInt = Field(default=5, alias="PROJECT_CACHE_TTL")
+    PROJECT_NEGATIVE_CACHE_TTL: PositiveInt = Field(default=5, alias="PROJECT_NEGATIVE_CACHE_TTL")
+
+
+@lru_cache
+def project_settings() -> ProjectSettings:
+    return ProjectSettings()
+
+
+settings = project_settings()
@@ -0,0 +1,22 @@
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import Field, PositiveInt
+from pydantic_settings import BaseSettings
+
+
+class RenderSettings(BaseSettings):
+    # Each worker holds its own copy of the renderers, size it to the CPUs left over by the service workers
+    RENDER_WORKERS: PositiveInt = Field(default=2, alias="RENDER_WORKERS")
+    RENDER_CACHE_SIZE: PositiveInt = Field(default=256, alias="RENDER_CACHE_SIZE")
+    RENDER_CACHE_MAX_AGE: PositiveInt = Field(default=86400, alias="RENDER_CACHE_MAX_AGE")
+    CLOUDTAGS_FONT_PATH: Optional[str] = Field(default=None, alias="CLOUDTAGS_FONT_PATH")
+    CLOUDTAGS_MASK_PATH: Optional[str] = Field(default=None, alias="CLOUDTAGS_MASK_PATH")
+
+
+@lru_cache
+def render_settings() -> RenderSettings:
+    return RenderSettings()
+
+
+settings = render_settings()
@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+from pydantic import Field, PositiveFloat, PositiveInt
+from pydantic_settings import BaseSettings
+
+
+class ReportSettings(BaseSettings):
+    REPORT_SECTION_TIMEOUT: PositiveFloat = Field(default=10.0, alias="REPORT_SECTION_TIMEOUT")
+    REPORT_JOB_TIMEOUT: PositiveInt = Field(default=600, alias="REPORT_JOB_TIMEOUT")
+    REPORT_BUCKET_NAME: str = Field(default="reports", alias="REPORT_BUCKET_NAME")
+    REPORT_FRAGMENT_CACHE_SIZE: PositiveInt = Field(default=512, alias="REPORT_FRAGMENT_CACHE_SIZE")
+
+
+@lru_cache
+def report_settings() -> ReportSettings:
+    return ReportSettings()
+
+
+settings = report_settings()
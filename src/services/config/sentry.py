@@ -1,6 +1,7 @@
 from functools import lru_cache
+from typing import Optional
 
-from pydantic import Field
+from pydantic import Field, PositiveFloat
 from pydantic_settings import BaseSettings
 
 
@@ -9,6 +10,17 @@ class SentrySettings(BaseSettings):
     SENTRY_RELEASE: str = Field(..., alias="SENTRY_RELEASE")
     SENTRY_ENVIRONMENT: str = Field(..., alias="SENTRY_ENVIRONMENT")
 
+    # PERFORMANCE TRACING CONFIG
+    SENTRY_TRACES_SAMPLE_RATE: float = Field(default=0.0, ge=0.0, le=1.0, alias="SENTRY_TRACES_SAMPLE_RATE")
+    # Transactions slower than this many seconds are always sent, whatever the sample rate
+    SENTRY_SLOW_TRANSACTION_THRESHOLD: Optional[PositiveFloat] = Field(
+        default=None, alias="SENTRY_SLOW_TRANSACTION_THRESHOLD"
+    )
+
+    @property
+    def tracing_enabled(self) -> bool:
+        return self.SENTRY_TRACES_SAMPLE_RATE > 0 or self.SENTRY_SLOW_TRANSACTION_THRESHOLD is not None
+
 
 @lru_cache
 def sentry_settings() -> SentrySettings:
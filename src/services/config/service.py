@@ -115,6 +115,13 @@ class Analyse(APIBaseSettings):
     openapi_url: str = "/analyse/openapi.json"
 
 
+class Gateway(APIBaseSettings):
+    API_PORT: int = Field(default=9090, alias="GATEWAY_PORT")
+    docs_url: str = "/docs"
+    title: str = "Yimba API"
+    openapi_url: str = "/openapi.json"
+
+
 def get(name: str) -> APIBaseSettings:
     match name:
         case "project":
@@ -137,5 +144,7 @@ def get(name: str) -> APIBaseSettings:
             return Rapport()
         case "cloudtags":
             return Cloudtags()
+        case "all":
+            return Gateway()
         case _:
             raise ValueError(f"Unknown API name: {name}")
@@ -1,3 +1,36 @@
-from .models import Analyse, Facebook, Google, Instagram, Project, Tiktok, Twitter, Youtube
+from .models import (
+    Analyse,
+    Facebook,
+    Google,
+    Instagram,
+    Project,
+    Report,
+    Sketch,
+    TermFrequency,
+    Tiktok,
+    Twitter,
+    Youtube,
+)
 
-document_models = [Analyse, Facebook, Google, Instagram, Youtube, Twitter, Tiktok, Project]
+document_models = [
+    Analyse,
+    Facebook,
+    Google,
+    Instagram,
+    Youtube,
+    Twitter,
+    Tiktok,
+    Project,
+    Sketch,
+    TermFrequency,
+    Report,
+]
+
+platform_models = {
+    "facebook": Facebook,
+    "google": Google,
+    "instagram": Instagram,
+    "youtube": Youtube,
+    "twitter": Twitter,
+    "tiktok": Tiktok,
+}
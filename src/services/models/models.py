@@ -1,48 +1,134 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from beanie import before_event, Document, Indexed
+from beanie import before_event, Document, Indexed, PydanticObjectId
 from beanie.odm.actions import EventTypes
-from pymongo import IndexModel, TEXT
+from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, IndexModel, TEXT
 from slugify import slugify
 
 from src.services.config.base import settings
-from src.services.schemas import CollectData, CreateAnalyse, CreateProject
+from src.services.schemas import CollectData, CreateAnalyse, CreateProject, ReportState
+from src.shared.text import edge_ngrams
 from .mixins import TimestampModel
 
 
+# Collected posts are upserted on (project, data.id) and loaded per project
+POST_INDEXES = [
+    IndexModel(keys=[("project", ASCENDING), ("data.id", ASCENDING)]),
+    IndexModel(keys=[("created_at", DESCENDING)]),
+]
+
+
 class Analyse(Document, CreateAnalyse, TimestampModel):
 
     class Settings:
         name = settings.ANALYSE_MODEL_NAME
+        indexes = [
+            IndexModel(keys=[("post_id", ASCENDING)]),
+            IndexModel(keys=[("created_at", DESCENDING)]),
+        ]
 
 
 class Facebook(Document, CollectData, TimestampModel):
-    pass
+
+    class Settings:
+        indexes = POST_INDEXES
 
 
 class Google(Document, CollectData, TimestampModel):
-    pass
+
+    class Settings:
+        indexes = POST_INDEXES
 
 
 class Instagram(Document, CollectData, TimestampModel):
-    pass
+
+    class Settings:
+        indexes = POST_INDEXES
 
 
 class Youtube(Document, CollectData, TimestampModel):
-    pass
+
+    class Settings:
+        indexes = POST_INDEXES
 
 
 class Twitter(Document, CollectData, TimestampModel):
-    pass
+
+    class Settings:
+        indexes = POST_INDEXES
 
 
 class Tiktok(Document, CollectData, TimestampModel):
-    pass
+
+    class Settings:
+        indexes = POST_INDEXES
+
+
+class Sketch(Document, TimestampModel):
+    project: str
+    platform: str
+    day: str
+    authors: bytes
+    hashtags: bytes
+    hashtag_candidates: List[Dict[str, Any]] = []
+    mentions: bytes
+    mention_candidates: List[Dict[str, Any]] = []
+    # Incremented on every update, concurrent writers compare and swap on it
+    version: int = 0
+
+    class Settings:
+        name = settings.SKETCH_MODEL_NAME
+        indexes = [
+            IndexModel(
+                keys=[("project", ASCENDING), ("platform", ASCENDING), ("day", ASCENDING)],
+                unique=True,
+            )
+        ]
+
+
+class TermFrequency(Document):
+    project: str
+    platform: str
+    term: str
+    frequency: int = 0
+
+    class Settings:
+        name = settings.TERM_MODEL_NAME
+        indexes = [
+            IndexModel(
+                keys=[("project", ASCENDING), ("platform", ASCENDING), ("term", ASCENDING)],
+                unique=True,
+            ),
+            IndexModel(keys=[("project", ASCENDING), ("platform", ASCENDING), ("frequency", DESCENDING)]),
+        ]
+
+
+class Report(Document, TimestampModel):
+    project: str
+    data_version: int
+    template_version: str
+    status: ReportState = ReportState.PENDING
+    file_id: Optional[PydanticObjectId] = None
+    etag: Optional[str] = None
+    size: Optional[int] = None
+    error: Optional[str] = None
+
+    class Settings:
+        name = settings.REPORT_MODEL_NAME
+        indexes = [
+            IndexModel(
+                keys=[("project", ASCENDING), ("data_version", ASCENDING), ("template_version", ASCENDING)],
+                unique=True,
+            )
+        ]
 
 
 class Project(Document, CreateProject, TimestampModel):
     user: Dict[str, Any]
     slug: Optional[Indexed(str, unique=True, sparse=True)] = None
+    data_version: int = 0
+    search_terms: List[str] = Field(default_factory=list, exclude=True)
 
     class Settings:
         name = settings.PROJECT_MODEL_NAME
@@ -52,7 +138,11 @@ class Project(Document, CreateProject, TimestampModel):
                     ("name", TEXT),
                     ("slug", TEXT),
                 ]
-            )
+            ),
+            IndexModel(keys=[("user._id", ASCENDING), ("slug", ASCENDING)]),
+            IndexModel(keys=[("user._id", ASCENDING), ("created_at", DESCENDING)]),
+            IndexModel(keys=[("created_at", DESCENDING)]),
+            IndexModel(keys=[("user._id", ASCENDING), ("search_terms", ASCENDING), ("created_at", DESCENDING)]),
         ]
 
     @before_event(EventTypes.INSERT)
@@ -63,3 +153,4 @@ class Project(Document, CreateProject, TimestampModel):
             raise
         else:
             self.slug = new_slug_value
+            self.search_terms = edge_ngrams(new_slug_value)
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from beanie import Document
+from pymongo import DESCENDING
+
+from . import platform_models
+from .models import Analyse, Project, Report, Sketch, TermFrequency
+
+
+@dataclass(frozen=True)
+class AuditQuery:
+    """
+    Shape of a query issued by the services, explained by `yimba db explain` to catch missing indexes.
+    """
+
+    name: str
+    model: Type[Document]
+    filter: Optional[Dict[str, Any]] = None
+    sort: Optional[List[Tuple[str, int]]] = None
+    pipeline: Optional[List[Dict[str, Any]]] = None
+
+
+def _post_queries(platform: str, model: Type[Document]) -> List[AuditQuery]:
+    return [
+        AuditQuery(f"{platform}.upsert-post", model, filter={"project": "sample", "data.id": "sample"}),
+        AuditQuery(f"{platform}.load-posts", model, filter={"project": "sample"}),
+        AuditQuery(
+            f"{platform}.totals",
+            model,
+            pipeline=[{"$match": {"project": "sample"}}, {"$group": {"_id": None, "likes": {"$sum": "$data.likes"}}}],
+        ),
+    ]
+
+
+def registry() -> List[AuditQuery]:
+    queries = [
+        AuditQuery("project.validate", Project, filter={"slug": "sample", "user._id": "sample"}),
+        AuditQuery("project.by-slug", Project, filter={"slug": "sample"}),
+        AuditQuery("project.slug-collisions", Project, filter={"slug": {"$in": ["sample", "other"]}}),
+        AuditQuery(
+            "project.autocomplete",
+            Project,
+            filter={"user._id": "sample", "search_terms": "sam"},
+            sort=[("created_at", DESCENDING)],
+        ),
+        AuditQuery("project.list", Project, filter={}, sort=[("created_at", DESCENDING)]),
+        AuditQuery("project.list-by-user", Project, filter={"user._id": "sample"}, sort=[("created_at", DESCENDING)]),
+        AuditQuery("analyse.by-post", Analyse, filter={"post_id": "sample"}),
+        AuditQuery("analyse.by-posts", Analyse, filter={"post_id": {"$in": ["sample", "other"]}}),
+        AuditQuery("analyse.list", Analyse, filter={}, sort=[("created_at", DESCENDING)]),
+        AuditQuery("sketch.day", Sketch, filter={"project": "sample", "platform": "sample", "day": "2024-01-01"}),
+        AuditQuery("sketch.range", Sketch, filter={"project": "sample", "day": {"$gte": "2024-01-01"}}),
+        AuditQuery(
+            "terms.top",
+            TermFrequency,
+            filter={"project": "sample", "platform": "sample"},
+            sort=[("frequency", DESCENDING)],
+        ),
+        AuditQuery(
+            "terms.top-all",
+            TermFrequency,
+            pipeline=[{"$match": {"project": "sample"}}, {"$group": {"_id": "$term", "f": {"$sum": "$frequency"}}}],
+        ),
+        AuditQuery(
+            "report.by-key",
+            Report,
+            filter={"project": "sample", "data_version": 0, "template_version": "sample"},
+        ),
+        AuditQuery("report.stale", Report, filter={"project": "sample", "status": {"$ne": "pending"}}),
+    ]
+    for platform, model in platform_models.items():
+        queries.extend(_post_queries(platform, model))
+    return queries
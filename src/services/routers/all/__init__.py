@@ -0,0 +1,82 @@
+from contextlib import asynccontextmanager
+from typing import cast
+
+from fastapi.responses import RedirectResponse
+from fastapi.staticfiles import StaticFiles
+from fastapi_pagination import add_pagination
+
+from src.common.helpers.appdesc import load_app_description, load_permissions
+from src.common.helpers.exceptions import setup_exception_handlers
+from src.services import FastYimbaAPI, models
+from src.services.config import service as service_config
+from src.services.config.database import shutdown_db_client, startup_db_client
+from src.services.routers.analyse.api import router as analyse_router
+from src.services.routers.cloudtags.api import router as cloudtags_router
+from src.services.routers.facebook.api import router as facebook_router
+from src.services.routers.google.api import router as google_router
+from src.services.routers.instagram.api import router as instagram_router
+from src.services.routers.project.api import router as project_router
+from src.services.routers.rapport.api import router as rapport_router
+from src.services.routers.tiktok.api import router as tiktok_router
+from src.services.routers.twitter.api import router as twitter_router
+from src.services.routers.youtube.api import router as youtube_router
+from src.shared.http_client import shutdown_http_client, startup_http_client
+from src.shared.metrics import setup_metrics
+from src.shared.render import shutdown_render_pool, startup_render_pool
+from src.shared.templating import compile_templates
+
+SETTINGS = cast(service_config.Gateway, service_config.get("all"))
+
+ROUTERS = [
+    project_router,
+    facebook_router,
+    tiktok_router,
+    twitter_router,
+    instagram_router,
+    google_router,
+    youtube_router,
+    analyse_router,
+    cloudtags_router,
+    rapport_router,
+]
+
+
+@asynccontextmanager
+async def lifespan(app: FastYimbaAPI):
+    # One Mongo pool, HTTP client and render pool shared by every router
+    await startup_db_client(app=app, document_models=models.document_models)
+
+    await load_app_description(mongodb_client=app.mongo_db_client)
+    await load_permissions(mongodb_client=app.mongo_db_client)
+    await startup_http_client()
+    await startup_render_pool()
+    compile_templates()
+
+    yield
+    await shutdown_render_pool()
+    await shutdown_http_client()
+    await shutdown_db_client(app=app)
+
+
+app: FastYimbaAPI = FastYimbaAPI(
+    lifespan=lifespan, title=SETTINGS.title, docs_url=SETTINGS.docs_url, openapi_url=SETTINGS.openapi_url
+)
+app.mount("/static", StaticFiles(directory="src/static"), name="static")
+
+
+@app.get("/", include_in_schema=False)
+async def read_root() -> RedirectResponse:
+    return RedirectResponse(url=f"{SETTINGS.docs_url}")
+
+
+def _ping():
+    return {"message": "pong !"}
+
+
+for router in ROUTERS:
+    app.add_api_route(f"{router.prefix}/@ping", _ping, methods=["GET"], tags=["DEFAULT"])
+    app.include_router(router)
+
+add_pagination(app)
+setup_metrics(app)
+setup_exception_handlers(app)
@@ -1,16 +1,19 @@
 import logging
-from typing import Optional
+from datetime import date
+from typing import List, Optional
 
 from fastapi import Depends, Query, status
+from pydantic import PositiveInt
 from fastapi_pagination.ext.beanie import paginate
 from pymongo import ASCENDING, DESCENDING
 
 from src.common.helpers.exceptions import CustomHTTException
-from src.common.helpers.permissions import CheckAccessAllow
-from src.services import models, router_factory
-from src.shared import crud
+from src.services import models, router_factory, schemas
+from src.shared import crud, utils
+from src.shared.auth_handler import CheckPermissions
 from src.shared.error_codes import YimbaApifyErrorCode
-from src.shared.url_patterns import CHECK_ACCESS_ALLOW_URL
+from src.shared.audience import summarize_audience
+from src.shared.columnar import COUNTERS
 from src.shared.utils import SortEnum
 
 logger = logging.getLogger(__name__)
@@ -25,7 +28,7 @@ router = router_factory(
 @router.get(
     "",
     response_model=crud.customize_page(models.Analyse),
-    dependencies=[Depends(CheckAccessAllow(url=CHECK_ACCESS_ALLOW_URL, permissions=["analyse:can-display-display"]))],
+    dependencies=[Depends(CheckPermissions(permissions=["analyse:can-display-display"]))],
     summary="Get all analyse sentiments by posts",
     status_code=status.HTTP_200_OK,
 )
@@ -49,7 +52,7 @@ async def get_post_sentiment(
 @router.get(
     "/{id}",
     response_model=models.Analyse,
-    dependencies=[Depends(CheckAccessAllow(url=CHECK_ACCESS_ALLOW_URL, permissions=["analyse:can-display-display"]))],
+    dependencies=[Depends(CheckPermissions(permissions=["analyse:can-display-display"]))],
     summary="Get single analyse post sentiment",
     status_code=status.HTTP_200_OK,
 )
@@ -62,3 +65,58 @@ async def get_analyse(id: str):
         )
 
     return document
+
+
+@router.get(
+    "/{keyword}/summary",
+    response_model=schemas.PostSummary,
+    dependencies=[Depends(CheckPermissions(permissions=["analyse:can-display-display"]))],
+    summary="Get aggregated statistics and sentiment of the posts collected for a keyword",
+    status_code=status.HTTP_200_OK,
+)
+async def get_summary(
+    keyword: str,
+    platforms: Optional[List[str]] = Query(None, description="Restrict to these platforms"),
+    metric: str = Query("engagement", description="Metric used to rank the top posts"),
+    top: PositiveInt = Query(10, description="Number of top posts to return"),
+):
+    if platforms and (unknown := set(platforms) - set(models.platform_models)):
+        raise CustomHTTException(
+            code_error=YimbaApifyErrorCode.VALUE_ERROR,
+            message_error=f"Unknown platforms: {', '.join(sorted(unknown))}",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    if metric != "engagement" and metric not in COUNTERS:
+        raise CustomHTTException(
+            code_error=YimbaApifyErrorCode.VALUE_ERROR,
+            message_error=f"Unknown metric: {metric}",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    batch = await utils.load_batch(keyword, platforms)
+
+    return schemas.PostSummary(
+        total=len(batch),
+        statistic=utils.to_statistic(batch),
+        percentiles={name: batch.percentiles(name) for name in (*COUNTERS, "engagement")},
+        mean_sentiment=batch.mean_sentiment(),
+        weighted_sentiment=batch.weighted_sentiment(),
+        top_posts=batch.ids[batch.top_k(metric, top)].tolist(),
+    )
+
+
+@router.get(
+    "/{keyword}/audience",
+    response_model=schemas.AudienceSummary,
+    dependencies=[Depends(CheckPermissions(permissions=["analyse:can-display-display"]))],
+    summary="Get unique authors and top hashtags/mentions for a keyword",
+    status_code=status.HTTP_200_OK,
+)
+async def get_audience(
+    keyword: str,
+    platforms: Optional[List[str]] = Query(None, description="Restrict to these platforms"),
+    start: Optional[date] = Query(None, description="First day (inclusive)"),
+    end: Optional[date] = Query(None, description="Last day (inclusive)"),
+    top: PositiveInt = Query(10, description="Number of hashtags and mentions to return"),
+):
+    return await summarize_audience(keyword, platforms=platforms, start=start, end=end, top=top)
@@ -1,10 +1,15 @@
 import logging
+from typing import Optional
 
-from fastapi import Depends, status
+from fastapi import Depends, Query, Request, Response, status
+from pydantic import PositiveInt
 
-from src.common.helpers.permissions import CheckAccessAllow
-from src.services import router_factory
-from src.shared.url_patterns import CHECK_ACCESS_ALLOW_URL
+from src.common.helpers.exceptions import CustomHTTException
+from src.services import models, router_factory, schemas
+from src.shared import cloudtags, renderers, utils
+from src.shared.auth_handler import CheckPermissions
+from src.shared.error_codes import YimbaApifyErrorCode
+from src.shared.render import image_response, not_modified, pool
 
 logger = logging.getLogger(__name__)
 
@@ -15,13 +20,74 @@ router = router_factory(
 )
 
 
+class CloudParams:
+    def __init__(
+        self,
+        platform: Optional[str] = Query(None, enum=list(models.platform_models), description="Restrict to a platform"),
+        limit: PositiveInt = Query(100, le=500, description="Number of terms in the cloud"),
+        width: PositiveInt = Query(800, le=2000),
+        height: PositiveInt = Query(400, le=2000),
+        style: str = Query("light", enum=list(renderers.STYLES)),
+    ):
+        self.platform = platform
+        self.limit = limit
+        self.width = width
+        self.height = height
+        self.style = style
+
+
 @router.get(
     "/{keyword}",
-    dependencies=[
-        Depends(CheckAccessAllow(url=CHECK_ACCESS_ALLOW_URL, permissions=["cloudtags:can-generete-cloudtags"]))
-    ],
+    response_model=schemas.CloudTags,
+    dependencies=[Depends(CheckPermissions(permissions=["cloudtags:can-generete-cloudtags"]))],
     status_code=status.HTTP_200_OK,
     summary="Generate cloud tags",
 )
-async def generate_cloudtags(keyword: str):
-    pass
+async def generate_cloudtags(keyword: str, params: CloudParams = Depends()):
+    await utils.validate_project(keyword)
+
+    frequencies = await cloudtags.top_terms(keyword, platform=params.platform, limit=params.limit)
+
+    image = None
+    if frequencies:
+        _, png = await pool.render(
+            renderers.render_cloud,
+            frequencies=frequencies,
+            width=params.width,
+            height=params.height,
+            style=params.style,
+        )
+        image = cloudtags.to_data_uri(png)
+
+    return schemas.CloudTags(
+        keyword=keyword,
+        frequencies=[schemas.TermCount(term=term, count=count) for term, count in frequencies.items()],
+        image=image,
+    )
+
+
+@router.get(
+    "/{keyword}/image",
+    dependencies=[Depends(CheckPermissions(permissions=["cloudtags:can-generete-cloudtags"]))],
+    response_class=Response,
+    responses={200: {"content": {"image/png": {}}}, 304: {"description": "Not modified"}},
+    status_code=status.HTTP_200_OK,
+    summary="Render cloud tags as a PNG image",
+)
+async def render_cloudtags(request: Request, keyword: str, params: CloudParams = Depends()):
+    await utils.validate_project(keyword)
+
+    if not (frequencies := await cloudtags.top_terms(keyword, platform=params.platform, limit=params.limit)):
+        raise CustomHTTException(
+            code_error=YimbaApifyErrorCode.DOCUMENT_NOT_FOUND,
+            message_error=f"No terms indexed for {keyword}",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    options = {"frequencies": frequencies, "width": params.width, "height": params.height, "style": params.style}
+    etag = pool.key(renderers.render_cloud, **options)
+    if not_modified(request, etag):
+        return image_response(request, etag, b"")
+
+    etag, png = await pool.render(renderers.render_cloud, **options)
+    return image_response(request, etag, png)
@@ -1,17 +1,18 @@
+import csv
 from typing import List, Optional
 
 from beanie import PydanticObjectId
-from fastapi import Body, Depends, Query, status
+from fastapi import Body, Depends, File, Query, status, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi_pagination.ext.beanie import paginate
 from pymongo import ASCENDING, DESCENDING
 
 from src.common.helpers.error_codes import AppErrorCode
 from src.common.helpers.exceptions import CustomHTTException
-from src.common.helpers.permissions import CheckAccessAllow
 from src.services import models, router_factory, schemas
-from src.shared import crud
-from src.shared.auth_handler import CheckUserInfoHandler
-from src.shared.url_patterns import CHECK_ACCESS_ALLOW_URL
+from src.services.config.project import settings
+from src.shared import crud, projects
+from src.shared.auth_handler import CheckPermissions
 from src.shared.utils import SortEnum
 
 router = router_factory(
@@ -21,35 +22,78 @@ router = router_factory(
 )
 
 
+def _check_names(names: List[str]):
+    if not names:
+        raise CustomHTTException(
+            code_error=AppErrorCode.REQUEST_VALIDATION_ERROR,
+            message_error="No valid project names provided",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    if len(names) > settings.PROJECT_BULK_MAX_ITEMS:
+        raise CustomHTTException(
+            code_error=AppErrorCode.REQUEST_VALIDATION_ERROR,
+            message_error=f"At most {settings.PROJECT_BULK_MAX_ITEMS} projects can be created at once",
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+
+
 @router.post(
     "",
     response_model=List[models.Project],
-    dependencies=[Depends(CheckAccessAllow(url=CHECK_ACCESS_ALLOW_URL, permissions=["project:can-create-project"]))],
     summary="Create new project",
 )
-async def create(user_info: dict = Depends(CheckUserInfoHandler()), payload: schemas.CreateProject = Body(...)):
-    projects = []
+async def create(
+    user_info: dict = Depends(CheckPermissions(permissions=["project:can-create-project"])),
+    payload: schemas.CreateProject = Body(...),
+):
     user = user_info.get("user_info", {})
-    keywords = [key.strip() for key in payload.name.split(",") if key.strip()]
+    keywords = projects.split_names(payload.name)
+    _check_names(keywords)
 
-    if not keywords:
+    documents, errors = await projects.prepare_projects(keywords, user)
+    if not errors:
+        documents, errors = await projects.insert_projects(documents)
+    if errors:
         raise CustomHTTException(
-            code_error=AppErrorCode.REQUEST_VALIDATION_ERROR,
-            message_error="No valid project names provided",
-            status_code=status.HTTP_400_BAD_REQUEST,
+            code_error=errors[0].code,
+            message_error="; ".join(error.message for error in errors),
+            status_code=status.HTTP_409_CONFLICT,
         )
 
-    for keyword in keywords:
-        project = await models.Project(name=keyword, user=user).create()
-        projects.append(project)
+    return documents
 
-    return projects
+
+@router.post(
+    "/bulk",
+    response_model=schemas.BulkProjects[models.Project],
+    summary="Create projects from an uploaded CSV or JSON file",
+    status_code=status.HTTP_207_MULTI_STATUS,
+)
+async def bulk_create(
+    user_info: dict = Depends(CheckPermissions(permissions=["project:can-create-project"])),
+    file: UploadFile = File(..., description="CSV (one name per row) or JSON array of project names"),
+):
+    data = await file.read()
+    try:
+        names = await run_in_threadpool(
+            projects.read_names, data, filename=file.filename or "", content_type=file.content_type or ""
+        )
+    except (ValueError, UnicodeDecodeError, csv.Error) as exc:
+        raise CustomHTTException(
+            code_error=AppErrorCode.REQUEST_VALIDATION_ERROR,
+            message_error=f"Unreadable file: {exc}",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        ) from exc
+    _check_names(names)
+
+    created, errors = await projects.create_projects(names, user_info.get("user_info", {}))
+    return schemas.BulkProjects[models.Project](created=created, errors=errors)
 
 
 @router.get(
     "",
     response_model=crud.customize_page(models.Project),
-    dependencies=[Depends(CheckAccessAllow(url=CHECK_ACCESS_ALLOW_URL, permissions=["project:can-read-project"]))],
+    dependencies=[Depends(CheckPermissions(permissions=["project:can-read-project"]))],
     summary="Get all projects",
 )
 async def all(
@@ -73,10 +117,24 @@ async def all(
     return await paginate(projects)
 
 
+@router.get(
+    "/autocomplete",
+    response_model=List[schemas.ProjectSuggestion],
+    summary="Suggest the user's projects matching a name prefix",
+)
+async def autocomplete(
+    user_info: dict = Depends(CheckPermissions(permissions=["project:can-read-project"])),
+    q: str = Query(..., min_length=1, description="Beginning of the project name"),
+    limit: int = Query(10, ge=1, le=50),
+):
+    user = user_info.get("user_info", {}).get("_id")
+    return await projects.suggest_projects(q, user=user, limit=limit)
+
+
 @router.get(
     "/{id}",
     response_model=models.Project,
-    dependencies=[Depends(CheckAccessAllow(url=CHECK_ACCESS_ALLOW_URL, permissions=["project:can-read-project"]))],
+    dependencies=[Depends(CheckPermissions(permissions=["project:can-read-project"]))],
     summary="Get single project",
 )
 async def read(id: PydanticObjectId):
@@ -86,17 +144,22 @@ async def read(id: PydanticObjectId):
 @router.patch(
     "/{id}",
     response_model=models.Project,
-    dependencies=[Depends(CheckAccessAllow(url=CHECK_ACCESS_ALLOW_URL, permissions=["project:can-update-project"]))],
+    dependencies=[Depends(CheckPermissions(permissions=["project:can-update-project"]))],
     summary="Update Project",
 )
 async def update(id: PydanticObjectId, payload: schemas.CreateProject = Body(...)):
-    return await crud.patch(models.Project, id=PydanticObjectId(id), payload=payload)
+    project = await crud.patch(models.Project, id=PydanticObjectId(id), payload=payload)
+    await project.set({models.Project.search_terms: projects.search_terms(project.name)})
+    projects.forget_project(project)
+    return project
 
 
 @router.delete(
     "/{id}",
-    dependencies=[Depends(CheckAccessAllow(url=CHECK_ACCESS_ALLOW_URL, permissions=["project:can-delete-project"]))],
+    dependencies=[Depends(CheckPermissions(permissions=["project:can-delete-project"]))],
     summary="Delete project",
 )
 async def delete(id: PydanticObjectId):
-    return await crud.delete(models.Project, id=PydanticObjectId(id))
+    project = await crud.get(models.Project, id=PydanticObjectId(id))
+    await project.delete()
+    projects.forget_project(project)
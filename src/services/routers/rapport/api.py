@@ -1,18 +1,17 @@
 import logging
 
-from fastapi import Request, Depends, status
-from fastapi.templating import Jinja2Templates
+from fastapi import BackgroundTasks, Depends, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, JSONResponse
 
-from src.services import router_factory
-from src.shared import utils
-from src.common.helpers.permissions import CheckAccessAllow
-from src.shared.url_patterns import CHECK_ACCESS_ALLOW_URL
+from src.services import router_factory, schemas
+from src.shared import report, utils
+from src.shared.auth_handler import CheckPermissions
+from src.shared.render import not_modified
+from src.shared.templating import templates
 
 logger = logging.getLogger(__name__)
 
-TEMPLATE_DIR = str("src/templates")
-templates = Jinja2Templates(directory=TEMPLATE_DIR)
-
 router = router_factory(
     prefix="/rapports",
     tags=["CRUD"],
@@ -22,34 +21,71 @@ router = router_factory(
 
 @router.get(
     "/{keyword}",
-    dependencies=[Depends(CheckAccessAllow(url=CHECK_ACCESS_ALLOW_URL, permissions=["report:can-generate-report"]))],
+    response_class=HTMLResponse,
+    dependencies=[Depends(CheckPermissions(permissions=["report:can-generate-report"]))],
     summary="Generate report",
     status_code=status.HTTP_200_OK,
 )
 async def generate_report(request: Request, keyword: str):
+    await utils.validate_project(keyword)
+
     context = {
-        "request": request,
         "page_title": keyword.upper(),
+        "background_url": str(request.url_for("static", path="img/bg.png")),
+        "logo_url": str(request.url_for("static", path="img/logo.png")),
     }
+    context.update(await report.build_report_context(keyword))
+
+    return HTMLResponse(templates.render_report(context))
+
+
+@router.post(
+    "/{keyword}/pdf",
+    response_model=schemas.ReportJob,
+    dependencies=[Depends(CheckPermissions(permissions=["report:can-generate-report"]))],
+    summary="Request the PDF report generation",
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def request_pdf_report(bg: BackgroundTasks, response: Response, keyword: str):
+    await utils.validate_project(keyword)
+
+    job = await report.ensure_pdf_report(bg, keyword)
+    if job.status == schemas.ReportState.READY:
+        response.status_code = status.HTTP_200_OK
+
+    return schemas.ReportJob.model_validate(job.model_dump())
+
+
+@router.get(
+    "/{keyword}/pdf",
+    dependencies=[Depends(CheckPermissions(permissions=["report:can-generate-report"]))],
+    response_class=Response,
+    responses={
+        200: {"content": {"application/pdf": {}}},
+        202: {"model": schemas.ReportJob, "description": "Report is being generated"},
+        304: {"description": "Not modified"},
+    },
+    summary="Download the PDF report",
+    status_code=status.HTTP_200_OK,
+)
+async def download_pdf_report(request: Request, bg: BackgroundTasks, keyword: str):
+    await utils.validate_project(keyword)
+
+    job = await report.ensure_pdf_report(bg, keyword)
+    if job.status != schemas.ReportState.READY:
+        return JSONResponse(
+            content=jsonable_encoder(schemas.ReportJob.model_validate(job.model_dump())),
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Retry-After": "5"},
+            background=bg,
+        )
+
+    headers = {"ETag": f'"{job.etag}"', "Cache-Control": "private, no-cache"}
+    if not_modified(request, job.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    fb_graphics = await utils.fb_graphic(keyword)
-    fb_statistic = await utils.get_fb_analyse(keyword)
-    fb_process_text = await utils.process_text_facebook(keyword)
-    fb_cloudtags_image = await utils.generate_cloud_tags_facebook(keyword)
-
-    tk_statistic = await utils.get_titktok_analyse(keyword)
-    inst_statistic = await utils.get_insta_analyse(keyword)
-    yt_statistic = await utils.get_yt_analyse(keyword)
-
-    dicts = [
-        fb_process_text,
-        fb_cloudtags_image,
-        inst_statistic,
-        tk_statistic,
-        fb_graphics,
-        fb_statistic,
-        yt_statistic,
-    ]
-    for d in dicts:
-        context.update(d)
-    return templates.TemplateResponse("pdf/pdf.html", context)
+    return Response(
+        content=await report.read_pdf_report(job),
+        media_type="application/pdf",
+        headers={**headers, "Content-Disposition": f'attachment; filename="{job.project}.pdf"'},
+    )
@@ -1,4 +1,33 @@
-from .schema import CollectData, CollectStatistic, CreateProject, CreateAnalyse, FacebookResponse
+from .schema import (
+    AudienceSummary,
+    BulkProjects,
+    CloudTags,
+    CollectData,
+    CollectStatistic,
+    CreateAnalyse,
+    CreateProject,
+    FacebookResponse,
+    PostSummary,
+    ProjectError,
+    ProjectSuggestion,
+    ReportJob,
+    ReportState,
+    TermCount,
+)
 
-
-__all__ = [CollectData, CollectStatistic, CreateProject, CreateAnalyse, FacebookResponse]
+__all__ = [
+    AudienceSummary,
+    BulkProjects,
+    CloudTags,
+    CollectData,
+    CollectStatistic,
+    CreateProject,
+    CreateAnalyse,
+    FacebookResponse,
+    PostSummary,
+    ProjectError,
+    ProjectSuggestion,
+    ReportJob,
+    ReportState,
+    TermCount,
+]
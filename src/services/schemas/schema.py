@@ -1,9 +1,13 @@
+from enum import StrEnum
 from typing import Optional
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, Generic, List, TypeVar
+
+T = TypeVar("T")
 
 
 class CollectData(BaseModel):
+    project: Optional[str] = None
     data: Dict[str, Any] = None
     analyse: Dict[str, Any] = None
 
@@ -15,6 +19,48 @@ class CollectStatistic(BaseModel):
     commentsCount: Optional[int] = 0
 
 
+class PostSummary(BaseModel):
+    total: int = 0
+    statistic: CollectStatistic = CollectStatistic()
+    percentiles: Dict[str, Dict[str, float]] = {}
+    mean_sentiment: Optional[float] = None
+    weighted_sentiment: Optional[float] = None
+    top_posts: List[str] = []
+
+
+class TermCount(BaseModel):
+    term: str
+    count: int
+
+
+class AudienceSummary(BaseModel):
+    days: int = 0
+    unique_authors: int = 0
+    top_hashtags: List[TermCount] = []
+    top_mentions: List[TermCount] = []
+
+
+class CloudTags(BaseModel):
+    keyword: str
+    frequencies: List[TermCount] = []
+    image: Optional[str] = None
+
+
+class ReportState(StrEnum):
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class ReportJob(BaseModel):
+    project: str
+    data_version: int
+    template_version: str
+    status: ReportState
+    etag: Optional[str] = None
+    error: Optional[str] = None
+
+
 class FacebookResponse(CollectStatistic):
     id: str
     postId: str
@@ -36,3 +82,20 @@ class CreateAnalyse(BaseModel):
 
 class CreateProject(BaseModel):
     name: str
+
+
+class ProjectSuggestion(BaseModel):
+    id: str
+    name: str
+    slug: str
+
+
+class ProjectError(BaseModel):
+    name: str
+    code: str
+    message: str
+
+
+class BulkProjects(BaseModel, Generic[T]):
+    created: List[T]
+    errors: List[ProjectError]
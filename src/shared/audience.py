@@ -0,0 +1,143 @@
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from pymongo.errors import DuplicateKeyError
+from slugify import slugify
+
+from src.services import models, schemas
+from .posts import Post
+from .sketches import CountMinSketch, extract_hashtags, extract_mentions, HeavyHitters, HyperLogLog
+
+_log = logging.getLogger(__name__)
+
+# Attempts to fold a batch into a daily sketch updated concurrently by other workers
+SKETCH_UPDATE_ATTEMPTS = 5
+
+
+def _day(timestamp: Optional[float]) -> str:
+    moment = datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp else datetime.now(tz=timezone.utc)
+    return moment.strftime("%Y-%m-%d")
+
+
+def _dump_candidates(candidates: Dict[str, int]) -> List[Dict[str, Any]]:
+    # Stored as pairs: handles such as "john.doe" cannot be used as field names
+    return [{"term": term, "count": count} for term, count in candidates.items()]
+
+
+def _load_candidates(value: Union[List[Dict[str, Any]], Dict[str, int], None]) -> Dict[str, int]:
+    # Sketches written before the pairs stored the candidates as a mapping
+    if isinstance(value, dict):
+        return value
+    return {item["term"]: item["count"] for item in value or []}
+
+
+def _load(doc: Optional[Dict]) -> tuple[HyperLogLog, HeavyHitters, HeavyHitters]:
+    if doc is None:
+        return HyperLogLog(), HeavyHitters(), HeavyHitters()
+    return (
+        HyperLogLog(registers=doc["authors"]),
+        HeavyHitters(
+            sketch=CountMinSketch(table=doc["hashtags"]), candidates=_load_candidates(doc.get("hashtag_candidates"))
+        ),
+        HeavyHitters(
+            sketch=CountMinSketch(table=doc["mentions"]), candidates=_load_candidates(doc.get("mention_candidates"))
+        ),
+    )
+
+
+async def _fold_day(collection, query: Dict, posts: List[Post]) -> bool:
+    """
+    Merge the posts into the sketch document of a day, False when another writer updated it first.
+    """
+
+    doc = await collection.find_one(query)
+    authors, hashtags, mentions = _load(doc)
+
+    authors.update(post.author for post in posts if post.author)
+    for post in posts:
+        hashtags.update(post.hashtags or extract_hashtags(post.text))
+        mentions.update(extract_mentions(post.text))
+
+    now = datetime.now()
+    fields = {
+        "authors": authors.to_bytes(),
+        "hashtags": hashtags.sketch.to_bytes(),
+        "hashtag_candidates": _dump_candidates(hashtags.candidates),
+        "mentions": mentions.sketch.to_bytes(),
+        "mention_candidates": _dump_candidates(mentions.candidates),
+        "updated_at": now,
+    }
+
+    if doc is None:
+        try:
+            await collection.insert_one({**query, **fields, "version": 1, "created_at": now})
+        except DuplicateKeyError:
+            return False
+        return True
+
+    # Documents written before versioning have no version field, matched by None
+    result = await collection.update_one(
+        {"_id": doc["_id"], "version": doc.get("version")},
+        {"$set": fields, "$inc": {"version": 1}},
+    )
+    return result.modified_count == 1
+
+
+async def record_sketches(platform: str, keyword: str, posts: List[Post]):
+    """
+    Fold newly ingested posts into the per project, platform and day sketches.
+    """
+
+    if not posts:
+        return
+
+    project = slugify(keyword)
+    collection = models.Sketch.get_motor_collection()
+
+    by_day = defaultdict(list)
+    for post in posts:
+        by_day[_day(post.timestamp)].append(post)
+
+    for day, day_posts in by_day.items():
+        query = {"project": project, "platform": platform, "day": day}
+        for _ in range(SKETCH_UPDATE_ATTEMPTS):
+            if await _fold_day(collection, query, day_posts):
+                break
+        else:
+            _log.error(f"Sketch of {query} updated concurrently, {len(day_posts)} posts not recorded.")
+
+
+async def summarize_audience(
+    keyword: str,
+    platforms: Optional[Sequence[str]] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    top: int = 10,
+) -> schemas.AudienceSummary:
+    query = {"project": slugify(keyword)}
+    if platforms:
+        query["platform"] = {"$in": list(platforms)}
+    if start or end:
+        query["day"] = {}
+        if start:
+            query["day"]["$gte"] = start.isoformat()
+        if end:
+            query["day"]["$lte"] = end.isoformat()
+
+    days = 0
+    authors, hashtags, mentions = _load(None)
+    async for doc in models.Sketch.get_motor_collection().find(query):
+        day_authors, day_hashtags, day_mentions = _load(doc)
+        authors.merge(day_authors)
+        hashtags.merge(day_hashtags)
+        mentions.merge(day_mentions)
+        days += 1
+
+    return schemas.AudienceSummary(
+        days=days,
+        unique_authors=authors.count() if days else 0,
+        top_hashtags=[schemas.TermCount(term=term, count=count) for term, count in hashtags.top(top)],
+        top_mentions=[schemas.TermCount(term=term, count=count) for term, count in mentions.top(top)],
+    )
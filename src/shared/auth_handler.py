@@ -1,46 +1,254 @@
+import asyncio
+import hashlib
 import logging
-from typing import Annotated
+import time
+from typing import Annotated, Dict, FrozenSet, Iterable, Optional, Tuple, TYPE_CHECKING
 
 import httpx
 from fastapi import Header, status
 
 from src.common.helpers.error_codes import AppErrorCode
 from src.common.helpers.exceptions import CustomHTTException
-from .url_patterns import CHECK_USERINFO_URL
+from src.services.config.auth import settings
+from .cache import TTLCache
+from .http_client import get_http_client
+from .url_patterns import CHECK_ACCESS_ALLOW_URL, CHECK_USERINFO_URL
+
+if TYPE_CHECKING:
+    import jwt
 
 _log = logging.getLogger(__name__)
 
 
+def token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _access_denied() -> CustomHTTException:
+    return CustomHTTException(
+        code_error=AppErrorCode.AUTH_ACCESS_DENIED,
+        message_error="Access denied",
+        status_code=status.HTTP_403_FORBIDDEN,
+    )
+
+
+class KeyUnavailable(Exception):
+    """
+    The token cannot be checked locally: opaque token, unknown key id or key set unreachable.
+    """
+
+
+class KeySet:
+    """
+    Signing keys of the auth service, fetched from its JWKS endpoint and refreshed periodically.
+    """
+
+    # Minimum delay between two refreshes triggered by an unknown key id
+    MIN_REFRESH_INTERVAL = 30
+
+    def __init__(self, url: Optional[str], refresh: int):
+        self.url = url
+        self.refresh_interval = refresh
+        self._keys: Dict[str, "jwt.PyJWK"] = {}
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() - self._fetched_at > self.refresh_interval
+
+    async def refresh(self, force: bool = False):
+        import jwt
+
+        if self.url is None:
+            raise KeyUnavailable("AUTH_JWKS_URL is not configured")
+
+        async with self._lock:
+            # Another request may have refreshed the key set while we were waiting
+            if not self.stale and not force:
+                return
+            if force and time.monotonic() - self._fetched_at < self.MIN_REFRESH_INTERVAL:
+                return
+
+            try:
+                response = await get_http_client().get(self.url)
+                response.raise_for_status()
+                key_set = jwt.PyJWKSet.from_dict(response.json())
+            except (httpx.HTTPError, jwt.PyJWKSetError, ValueError) as exc:
+                _log.error(f"Unable to refresh signing keys from {self.url!r}: {exc}")
+                if not self._keys:
+                    raise KeyUnavailable("Signing keys unavailable") from exc
+                # Keep serving the previous keys, retry after the minimum interval
+                self._fetched_at = time.monotonic() - self.refresh_interval + self.MIN_REFRESH_INTERVAL
+                return
+
+            self._keys = {key.key_id: key for key in key_set.keys if key.key_id}
+            self._fetched_at = time.monotonic()
+
+    async def get(self, kid: Optional[str]) -> "jwt.PyJWK":
+        if self.stale:
+            await self.refresh()
+        if kid not in self._keys:
+            # The auth service may have rotated its keys
+            await self.refresh(force=True)
+        if (key := self._keys.get(kid)) is None:
+            raise KeyUnavailable(f"Unknown signing key {kid!r}")
+        return key
+
+
 class CheckUserInfoHandler:
     """
     Handler to verify access token.
     """
 
+    # Shared by every handler instance so all routes of a service hit the same cache
+    cache: TTLCache[str, dict] = TTLCache(
+        maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL, name="auth_userinfo"
+    )
+    keys: KeySet = KeySet(url=settings.AUTH_JWKS_URL, refresh=settings.AUTH_JWKS_REFRESH)
+
     def __init__(self):
         self.url = CHECK_USERINFO_URL
 
-    async def __call__(self, authorization: Annotated[str, Header(...)]):
-        token = authorization.split()[1]
+    async def verify_locally(self, token: str) -> dict:
+        # Only services configured for local verification load PyJWT and cryptography
+        import jwt
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.url, params={"token": token})
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.DecodeError as exc:
+            raise KeyUnavailable("Token is not a JWT") from exc
+
+        key = await self.keys.get(header.get("kid"))
+        try:
+            claims = jwt.decode(
+                token,
+                key=key.key,
+                algorithms=settings.AUTH_JWT_ALGORITHMS,
+                audience=settings.AUTH_JWT_AUDIENCE,
+                issuer=settings.AUTH_JWT_ISSUER,
+                leeway=settings.AUTH_JWT_LEEWAY,
+                options={"require": ["exp"], "verify_aud": settings.AUTH_JWT_AUDIENCE is not None},
+            )
+        except jwt.InvalidTokenError as exc:
+            _log.info(f"Rejected token: {exc}")
+            raise _access_denied() from exc
+
+        # Same shape as the introspection response
+        user_info = claims.get(settings.AUTH_JWT_USERINFO_CLAIM) or {"_id": claims.get("sub")}
+        return {**claims, "active": True, "user_info": user_info}
+
+    async def introspect(self, token: str) -> dict:
+        response = await get_http_client().get(self.url, params={"token": token})
 
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             _log.error(f"Error response {exc.response.status_code} while requesting {exc.request.url!r}.")
-            raise CustomHTTException(
-                code_error=AppErrorCode.AUTH_ACCESS_DENIED,
-                message_error="Access denied",
-                status_code=status.HTTP_403_FORBIDDEN,
-            ) from exc
-
-        ret = response.json()["active"] if response.is_success else False
-        if ret is False:
-            raise CustomHTTException(
-                code_error=AppErrorCode.AUTH_ACCESS_DENIED,
-                message_error="Access denied",
-                status_code=status.HTTP_403_FORBIDDEN,
-            )
+            raise _access_denied() from exc
+
+        userinfo = response.json()
+        if userinfo.get("active") is not True:
+            raise _access_denied()
+        return userinfo
+
+    async def __call__(self, authorization: Annotated[str, Header(...)]):
+        token = authorization.split()[1]
+        key = token_key(token)
+
+        if (userinfo := self.cache.get(key)) is not None:
+            return userinfo
+
+        if settings.AUTH_VERIFY_MODE == "local":
+            try:
+                userinfo = await self.verify_locally(token)
+            except KeyUnavailable as exc:
+                if not settings.AUTH_REMOTE_FALLBACK:
+                    raise _access_denied() from exc
+                _log.warning(f"Falling back to remote introspection: {exc}")
+                userinfo = await self.introspect(token)
+        else:
+            userinfo = await self.introspect(token)
+
+        # Never keep a token in cache past its own expiry
+        ttl = None
+        if (exp := userinfo.get("exp")) is not None:
+            ttl = float(exp) - time.time()
+        self.cache.set(key, userinfo, ttl=ttl)
+
+        return userinfo
+
+
+def user_permissions(userinfo: dict) -> Optional[FrozenSet[str]]:
+    """
+    Permission codes carried by the user info, None when the auth service does not include them.
+    """
+
+    claim = settings.AUTH_PERMISSIONS_CLAIM
+    granted = userinfo.get(claim)
+    if granted is None and isinstance(userinfo.get("user_info"), dict):
+        granted = userinfo["user_info"].get(claim)
+    if granted is None:
+        return None
+    return frozenset(item.get("code") if isinstance(item, dict) else item for item in granted)
+
+
+class CheckPermissions:
+    """
+    Verify the access token and the route permissions in a single dependency, returning the user info.
+    """
+
+    userinfo_handler = CheckUserInfoHandler()
+    permission_sets: TTLCache[str, FrozenSet[str]] = TTLCache(
+        maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_PERMISSION_CACHE_TTL, name="auth_permissions"
+    )
+    decisions: TTLCache[Tuple[str, FrozenSet[str]], bool] = TTLCache(
+        maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_PERMISSION_CACHE_TTL, name="auth_decisions"
+    )
+
+    def __init__(self, permissions: Iterable[str], url: str = CHECK_ACCESS_ALLOW_URL):
+        self.permissions = frozenset(permissions)
+        self.url = url
+
+    async def check_remote(self, authorization: str, key: str) -> bool:
+        if (allowed := self.decisions.get((key, self.permissions))) is not None:
+            return allowed
+
+        response = await get_http_client().get(
+            self.url,
+            headers={"Authorization": authorization},
+            params=[("permission", permission) for permission in sorted(self.permissions)],
+        )
+        if response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN):
+            allowed = False
+        else:
+            try:
+                response.raise_for_status()
+                decision = response.json()
+            except httpx.HTTPStatusError as exc:
+                _log.error(f"Error response {exc.response.status_code} while requesting {exc.request.url!r}.")
+                raise _access_denied() from exc
+            except ValueError as exc:
+                _log.error(f"Invalid access decision returned by {self.url!r}.")
+                raise _access_denied() from exc
+            # Only an explicit grant allows the request
+            allowed = isinstance(decision, dict) and decision.get("access") is True
+
+        self.decisions.set((key, self.permissions), allowed)
+        return allowed
+
+    async def __call__(self, authorization: Annotated[str, Header(...)]) -> dict:
+        userinfo = await self.userinfo_handler(authorization)
+        key = token_key(authorization.split()[1])
+
+        if (granted := self.permission_sets.get(key)) is None and (granted := user_permissions(userinfo)) is not None:
+            self.permission_sets.set(key, granted)
+
+        if granted is not None:
+            allowed = not self.permissions.isdisjoint(granted)
+        else:
+            allowed = await self.check_remote(authorization, key)
 
-        return response.json()
+        if not allowed:
+            raise _access_denied()
+        return userinfo
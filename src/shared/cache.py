@@ -0,0 +1,79 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from .metrics import record_cache
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Bounded in-process cache evicting the least recently used entry.
+    """
+
+    def __init__(self, maxsize: int, name: Optional[str] = None):
+        self.maxsize = maxsize
+        # Named caches report their hit ratio in the service metrics
+        self.name = name
+        self._items: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: K) -> Optional[V]:
+        if (value := self._items.get(key)) is not None:
+            self._items.move_to_end(key)
+        record_cache(self.name, value is not None)
+        return value
+
+    def set(self, key: K, value: V):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        return self._items.pop(key, None)
+
+    def clear(self):
+        self._items.clear()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded LRU cache whose entries expire after a time to live.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, name: Optional[str] = None):
+        self.ttl = ttl
+        self.name = name
+        self._items: LRUCache[K, Tuple[float, V]] = LRUCache(maxsize)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: K) -> Optional[V]:
+        if (entry := self._items.get(key)) is None:
+            record_cache(self.name, False)
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._items.pop(key)
+            record_cache(self.name, False)
+            return None
+        record_cache(self.name, True)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl > 0:
+            self._items.set(key, (time.monotonic() + ttl, value))
+
+    def pop(self, key: K) -> Optional[V]:
+        entry = self._items.pop(key)
+        return entry[1] if entry is not None else None
+
+    def clear(self):
+        self._items.clear()
@@ -0,0 +1,52 @@
+import base64
+from typing import Dict, List, Optional
+
+import sentry_sdk
+from pymongo import UpdateOne
+from slugify import slugify
+
+from src.services import models
+from .posts import Post
+from .text import term_frequencies
+
+
+async def index_terms(platform: str, keyword: str, posts: List[Post]):
+    """
+    Add the terms of newly ingested posts to the project term-frequency index.
+    """
+
+    counts = term_frequencies(post.text for post in posts)
+    if not counts:
+        return
+
+    project = slugify(keyword)
+    operations = [
+        UpdateOne({"project": project, "platform": platform, "term": term}, {"$inc": {"frequency": count}}, upsert=True)
+        for term, count in counts.items()
+    ]
+    with sentry_sdk.start_span(op="db.bulk_write", name="terms") as span:
+        span.set_data("operations", len(operations))
+        await models.TermFrequency.get_motor_collection().bulk_write(operations, ordered=False)
+
+
+async def top_terms(keyword: str, platform: Optional[str] = None, limit: int = 100) -> Dict[str, int]:
+    collection = models.TermFrequency.get_motor_collection()
+    project = slugify(keyword)
+
+    if platform:
+        cursor = collection.find(
+            {"project": project, "platform": platform}, {"_id": 0, "term": 1, "frequency": 1}, sort=[("frequency", -1)]
+        ).limit(limit)
+        return {doc["term"]: doc["frequency"] async for doc in cursor}
+
+    pipeline = [
+        {"$match": {"project": project}},
+        {"$group": {"_id": "$term", "frequency": {"$sum": "$frequency"}}},
+        {"$sort": {"frequency": -1}},
+        {"$limit": limit},
+    ]
+    return {doc["_id"]: doc["frequency"] async for doc in collection.aggregate(pipeline)}
+
+
+def to_data_uri(image: bytes, media_type: str = "image/png") -> str:
+    return f"data:{media_type};base64,{base64.b64encode(image).decode('ascii')}"
@@ -0,0 +1,120 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .posts import Post
+
+COUNTERS = ("likes", "shares", "views", "comments")
+
+
+class PostBatch:
+    """
+    Columnar view of a result set: counters, timestamps and sentiment scores
+    are stored as NumPy arrays so aggregations run vectorized.
+    """
+
+    __slots__ = ("ids", "platforms", "likes", "shares", "views", "comments", "timestamps", "sentiments")
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        platforms: Sequence[str],
+        counters: Mapping[str, np.ndarray],
+        timestamps: np.ndarray,
+        sentiments: Optional[np.ndarray] = None,
+    ):
+        self.ids = np.asarray(ids, dtype=object)
+        self.platforms = np.asarray(platforms, dtype=object)
+        self.likes = counters["likes"]
+        self.shares = counters["shares"]
+        self.views = counters["views"]
+        self.comments = counters["comments"]
+        self.timestamps = timestamps
+        self.sentiments = sentiments if sentiments is not None else np.full(len(self.ids), np.nan)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> "PostBatch":
+        records = list(records)
+        size = len(records)
+
+        counters = {
+            name: np.fromiter((r.get(name) or 0 for r in records), dtype=np.int64, count=size) for name in COUNTERS
+        }
+        timestamps = np.fromiter(
+            (np.nan if r.get("timestamp") is None else r["timestamp"] for r in records), dtype=np.float64, count=size
+        )
+        return cls(
+            ids=[r.get("id") for r in records],
+            platforms=[r.get("platform") for r in records],
+            counters=counters,
+            timestamps=timestamps,
+        )
+
+    @classmethod
+    def from_posts(cls, posts: Sequence[Post]) -> "PostBatch":
+        size = len(posts)
+        counters = {
+            name: np.fromiter((getattr(p, name) for p in posts), dtype=np.int64, count=size) for name in COUNTERS
+        }
+        timestamps = np.fromiter(
+            (np.nan if p.timestamp is None else p.timestamp for p in posts), dtype=np.float64, count=size
+        )
+        return cls(
+            ids=[p.id for p in posts], platforms=[p.platform for p in posts], counters=counters, timestamps=timestamps
+        )
+
+    def with_sentiments(self, scores: Mapping[str, float]) -> "PostBatch":
+        self.sentiments = np.fromiter(
+            (scores.get(post_id, np.nan) for post_id in self.ids), dtype=np.float64, count=len(self)
+        )
+        return self
+
+    def column(self, metric: str) -> np.ndarray:
+        if metric == "engagement":
+            return self.engagement
+        if metric not in COUNTERS:
+            raise ValueError(f"Unknown metric: {metric}")
+        return getattr(self, metric)
+
+    @property
+    def engagement(self) -> np.ndarray:
+        return self.likes + self.shares + self.comments
+
+    def totals(self) -> Dict[str, int]:
+        return {name: int(getattr(self, name).sum()) for name in COUNTERS}
+
+    def percentiles(self, metric: str, q: Sequence[float] = (50, 90, 99)) -> Dict[str, float]:
+        values = self.column(metric)
+        if not len(values):
+            return {f"p{int(x)}": 0.0 for x in q}
+        return {f"p{int(x)}": float(v) for x, v in zip(q, np.percentile(values, q))}
+
+    def mean_sentiment(self) -> Optional[float]:
+        scored = self.sentiments[~np.isnan(self.sentiments)]
+        return float(scored.mean()) if scored.size else None
+
+    def weighted_sentiment(self) -> Optional[float]:
+        mask = ~np.isnan(self.sentiments)
+        if not mask.any():
+            return None
+        weights = self.engagement[mask] + 1
+        return float(np.average(self.sentiments[mask], weights=weights))
+
+    def top_k(self, metric: str, k: int = 10) -> List[int]:
+        values = self.column(metric)
+        if k <= 0 or not len(values):
+            return []
+        if k < len(values):
+            candidates = np.argpartition(values, -k)[-k:]
+        else:
+            candidates = np.arange(len(values))
+        return candidates[np.argsort(values[candidates])[::-1]].tolist()
+
+    def time_range(self) -> Dict[str, Optional[float]]:
+        dated = self.timestamps[~np.isnan(self.timestamps)]
+        if not dated.size:
+            return {"start": None, "end": None}
+        return {"start": float(dated.min()), "end": float(dated.max())}
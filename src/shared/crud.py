@@ -1,15 +1,17 @@
-from typing import Type
+from typing import Any, Sequence, Type
 
 from beanie import Document, PydanticObjectId
 from fastapi import HTTPException, Body, status
 from fastapi.encoders import jsonable_encoder
 from fastapi_pagination import Page
 from fastapi_pagination.customization import CustomizedPage, UseOptionalParams
-from fastapi_pagination.utils import disable_installed_extensions_check
+from fastapi_pagination.api import create_page
+from fastapi_pagination.utils import disable_installed_extensions_check, verify_params
 from pydantic import BaseModel
 
 from src.common.helpers.exceptions import CustomHTTException
 from .error_codes import YimbaApifyErrorCode
+from .responses import ORJSONResponse
 
 disable_installed_extensions_check()
 
@@ -18,6 +20,18 @@ def customize_page(model):
     return CustomizedPage[Page, UseOptionalParams()]
 
 
+def paginate_trusted(items: Sequence[Any]) -> ORJSONResponse:
+    """
+    Page of already normalized, JSON compatible items (actor datasets), returned as a response so FastAPI
+    skips validating and encoding every item against the response model.
+    """
+
+    params, raw_params = verify_params(None, "limit-offset")
+    content = create_page([], total=len(items) if raw_params.include_total else None, params=params).model_dump()
+    content["items"] = items[raw_params.as_slice()]
+    return ORJSONResponse(content)
+
+
 def encode_input(data) -> dict:
     req = jsonable_encoder(data)
     data = {k: v for k, v in req.items()}
@@ -0,0 +1,107 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import monitoring
+
+from src.services.config.base import settings
+from .metrics import (
+    MONGO_DURATION,
+    MONGO_FAILURES,
+    MONGO_ROUTE_COMMANDS,
+    MONGO_ROUTE_SECONDS,
+    RequestContext,
+    current_request,
+)
+
+_log = logging.getLogger(__name__)
+
+# Commands timed by the listener, the others (handshakes, heartbeats, sessions...) are ignored
+TIMED_COMMANDS = frozenset(
+    {"find", "getMore", "aggregate", "count", "distinct", "insert", "update", "delete", "findAndModify", "explain"}
+)
+
+# Route label of the commands issued outside of a request: startup, background jobs, CLI
+NO_ROUTE = "none"
+
+
+def _collection(command: Dict[str, Any], command_name: str) -> str:
+    collection = command.get("collection" if command_name == "getMore" else command_name)
+    return collection if isinstance(collection, str) else ""
+
+
+def _shape(command: Dict[str, Any]) -> List[str]:
+    """
+    Filtered fields or pipeline stages of a command, logged without their values.
+    """
+
+    if isinstance(pipeline := command.get("pipeline"), list):
+        return [next(iter(stage), "") for stage in pipeline if isinstance(stage, dict)]
+    for key in ("filter", "query"):
+        if isinstance(query := command.get(key), dict):
+            return sorted(query)
+    return []
+
+
+class CommandTimer(monitoring.CommandListener):
+    """
+    Record the latency of every MongoDB command issued by the service, by command, collection and route, and
+    log the slow ones.
+    """
+
+    def __init__(self, slow_ms: int):
+        self.slow_ms = slow_ms
+        # (connection, request id) -> (collection, shape, request), the succeeded and failed events do not
+        # carry the command. The request is read from the context of the thread starting the command.
+        self._started: Dict[Tuple[object, int], Tuple[str, List[str], Optional[RequestContext]]] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        if event.command_name in TIMED_COMMANDS:
+            self._started[(event.connection_id, event.request_id)] = (
+                _collection(event.command, event.command_name),
+                _shape(event.command),
+                current_request.get(),
+            )
+
+    def _finished(self, event, failed: bool):
+        if (started := self._started.pop((event.connection_id, event.request_id), None)) is None:
+            return
+
+        collection, shape, request = started
+        duration = event.duration_micros / 1e6
+        route = NO_ROUTE
+        if request is not None:
+            request.commands += 1
+            route = request.route
+
+        MONGO_DURATION.observe(duration, event.command_name, collection)
+        MONGO_ROUTE_COMMANDS.inc(route, event.command_name, collection)
+        MONGO_ROUTE_SECONDS.inc(route, amount=duration)
+        if failed:
+            MONGO_FAILURES.inc(event.command_name)
+
+        if duration * 1000 >= self.slow_ms:
+            _log.warning(
+                f"Slow MongoDB {event.command_name} on {collection!r} from {route}: {duration * 1000:.1f} ms "
+                f"(fields: {', '.join(shape) or '-'})"
+            )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._finished(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._finished(event, failed=True)
+
+
+_listener = None
+
+
+def register_listener():
+    """
+    Register the listener once per process, before the client is created: pymongo only attaches global
+    listeners to clients created after their registration.
+    """
+
+    global _listener
+    if _listener is None:
+        _listener = CommandTimer(slow_ms=settings.MONGO_SLOW_COMMAND_MS)
+        monitoring.register(_listener)
@@ -0,0 +1,39 @@
+import logging
+from typing import Optional
+
+import httpx
+
+from src.services.config.auth import settings
+
+_log = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared pooled client, so calls to the auth service reuse open connections.
+    """
+
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=settings.AUTH_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.AUTH_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.AUTH_HTTP_MAX_KEEPALIVE,
+            ),
+        )
+    return _client
+
+
+async def startup_http_client():
+    get_http_client()
+    _log.info("--> HTTP client started !")
+
+
+async def shutdown_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
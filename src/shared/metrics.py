@@ -0,0 +1,221 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ACTOR_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+SIZE_BUCKETS = (1, 10, 50, 100, 500, 1000, 5000)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def collect(self) -> List[str]:
+        lines = self.header()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> (per bucket counts, +Inf included, sum)
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(labels, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def collect(self) -> List[str]:
+        lines = self.header()
+        names = self.labelnames + ("le",)
+        for labels, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_labels(names, (*labels, bound))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {total[0]}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """
+    In-process metrics exposed in the Prometheus text format. Each worker process has its own registry.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.setdefault(metric.name, metric)
+        return self._metrics[metric.name]
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUEST_DURATION = registry.histogram(
+    "yimba_http_request_duration_seconds", "HTTP request latency by route", ("method", "route", "status")
+)
+ACTOR_DURATION = registry.histogram(
+    "yimba_actor_run_duration_seconds", "Apify actor run duration by stage", ("platform", "stage"), ACTOR_BUCKETS
+)
+ACTOR_ITEMS = registry.histogram("yimba_actor_items", "Items returned by an actor run", ("platform",), SIZE_BUCKETS)
+ACTOR_FAILURES = registry.counter("yimba_actor_failures_total", "Failed actor runs", ("platform",))
+SENTIMENT_DURATION = registry.histogram("yimba_sentiment_duration_seconds", "Sentiment scoring time per post")
+SENTIMENT_POSTS = registry.counter("yimba_sentiment_posts_total", "Posts scored for sentiment")
+MONGO_DURATION = registry.histogram(
+    "yimba_mongo_command_duration_seconds", "MongoDB command latency", ("command", "collection")
+)
+MONGO_FAILURES = registry.counter("yimba_mongo_command_failures_total", "Failed MongoDB commands", ("command",))
+MONGO_ROUTE_COMMANDS = registry.counter(
+    "yimba_mongo_route_commands_total", "MongoDB commands issued by route", ("route", "command", "collection")
+)
+MONGO_ROUTE_SECONDS = registry.counter(
+    "yimba_mongo_route_seconds_total", "Time spent in MongoDB commands by route", ("route",)
+)
+MONGO_COMMANDS_PER_REQUEST = registry.histogram(
+    "yimba_mongo_commands_per_request", "MongoDB commands issued by a single request", ("route",), SIZE_BUCKETS
+)
+CACHE_REQUESTS = registry.counter("yimba_cache_requests_total", "In-process cache lookups", ("cache", "result"))
+
+
+def record_cache(name: Optional[str], hit: bool):
+    if name is not None:
+        CACHE_REQUESTS.inc(name, "hit" if hit else "miss")
+
+
+class RequestContext:
+    """
+    Request being served by the current task, shared with the threads running its MongoDB commands.
+    """
+
+    __slots__ = ("scope", "commands")
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.commands = 0
+
+    @property
+    def route(self) -> str:
+        # Only known once the router matched the request
+        return getattr(self.scope.get("route"), "path", "unmatched")
+
+
+current_request: ContextVar[Optional[RequestContext]] = ContextVar("current_request", default=None)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware timing every HTTP request, labelled with the route template rather than the raw path.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started = time.perf_counter()
+        status_code = 500
+        elapsed = None
+        context = RequestContext(scope)
+        token = current_request.set(context)
+
+        async def send_with_status(message):
+            nonlocal status_code, elapsed
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            # Background tasks run after the last body message, outside of the route latency
+            if message["type"] == "http.response.body" and not message.get("more_body", False) and elapsed is None:
+                elapsed = time.perf_counter() - started
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            current_request.reset(token)
+            if elapsed is None:
+                elapsed = time.perf_counter() - started
+            route = context.route
+            REQUEST_DURATION.observe(elapsed, scope["method"], route, str(status_code))
+            MONGO_COMMANDS_PER_REQUEST.observe(context.commands, route)
+
+
+def setup_metrics(app: FastAPI, prefix: str = ""):
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get(f"{prefix}/@metrics", tags=["DEFAULT"], response_class=PlainTextResponse)
+    def metrics():
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,205 @@
+from dataclasses import dataclass, fields
+from datetime import datetime
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class Post:
+    """
+    Compact, platform independent representation of a collected post.
+    """
+
+    id: str
+    platform: str
+    author: Optional[str] = None
+    text: str = ""
+    timestamp: Optional[float] = None
+    likes: int = 0
+    shares: int = 0
+    views: int = 0
+    comments: int = 0
+    url: Optional[str] = None
+    hashtags: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in POST_FIELDS}
+
+
+POST_FIELDS = tuple(f.name for f in fields(Post))
+
+
+def _int(value: Any) -> int:
+    if value is None or isinstance(value, bool):
+        return 0
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _str(value: Any) -> Optional[str]:
+    return str(value) if value not in (None, "") else None
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        # Some actors return epoch milliseconds
+        return value / 1000 if value > 1e11 else float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return _timestamp(float(value))
+        except ValueError:
+            pass
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+        try:
+            return datetime.strptime(value, "%a %b %d %H:%M:%S %z %Y").timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _hashtags(values: Any) -> Tuple[str, ...]:
+    if not values:
+        return ()
+    tags = []
+    for value in values:
+        tag = value.get("name") if isinstance(value, dict) else value
+        if tag:
+            tags.append(str(tag).lstrip("#").lower())
+    return tuple(tags)
+
+
+def _facebook(item: Dict[str, Any]) -> Post:
+    user = item.get("user") or {}
+    return Post(
+        id=_str(item.get("postId")),
+        platform="facebook",
+        author=_str(user.get("id") or user.get("name")),
+        text=item.get("text") or "",
+        timestamp=_timestamp(item.get("timestamp") or item.get("time") or item.get("date")),
+        likes=_int(item.get("likesCount")),
+        shares=_int(item.get("sharesCount")),
+        views=_int(item.get("viewsCount")),
+        comments=_int(item.get("commentsCount")),
+        url=_str(item.get("url")),
+        hashtags=_hashtags(item.get("hashtags")),
+    )
+
+
+def _tiktok(item: Dict[str, Any]) -> Post:
+    author = item.get("authorMeta") or {}
+    return Post(
+        id=_str(item.get("id")),
+        platform="tiktok",
+        author=_str(author.get("id") or author.get("name")),
+        text=item.get("text") or "",
+        timestamp=_timestamp(item.get("createTime") or item.get("createTimeISO")),
+        likes=_int(item.get("diggCount")),
+        shares=_int(item.get("shareCount")),
+        views=_int(item.get("playCount")),
+        comments=_int(item.get("commentCount")),
+        url=_str(item.get("webVideoUrl")),
+        hashtags=_hashtags(item.get("hashtags")),
+    )
+
+
+def _twitter(item: Dict[str, Any]) -> Post:
+    user = item.get("user") or {}
+    entities = item.get("entities") or {}
+    return Post(
+        id=_str(item.get("id_str") or item.get("id")),
+        platform="twitter",
+        author=_str(user.get("screen_name") or user.get("id_str")),
+        text=item.get("full_text") or item.get("text") or "",
+        timestamp=_timestamp(item.get("created_at")),
+        likes=_int(item.get("favorite_count")),
+        shares=_int(item.get("retweet_count")),
+        views=_int(item.get("view_count")),
+        comments=_int(item.get("reply_count")),
+        url=_str(item.get("url")),
+        hashtags=_hashtags(tag.get("text") for tag in entities.get("hashtags", [])),
+    )
+
+
+def _instagram(item: Dict[str, Any]) -> Post:
+    return Post(
+        id=_str(item.get("id")),
+        platform="instagram",
+        author=_str(item.get("ownerId") or item.get("ownerUsername")),
+        text=item.get("caption") or "",
+        timestamp=_timestamp(item.get("timestamp")),
+        likes=_int(item.get("likesCount")),
+        shares=0,
+        views=_int(item.get("videoViewCount")),
+        comments=_int(item.get("commentsCount")),
+        url=_str(item.get("url")),
+        hashtags=_hashtags(item.get("hashtags")),
+    )
+
+
+def _youtube(item: Dict[str, Any]) -> Post:
+    return Post(
+        id=_str(item.get("id")),
+        platform="youtube",
+        author=_str(item.get("channelId") or item.get("channelName")),
+        text=item.get("text") or item.get("title") or "",
+        timestamp=_timestamp(item.get("date")),
+        likes=_int(item.get("likes")),
+        shares=_int(item.get("shareCount")),
+        views=_int(item.get("viewCount")),
+        comments=_int(item.get("commentsCount")),
+        url=_str(item.get("url")),
+        hashtags=_hashtags(item.get("hashtags")),
+    )
+
+
+def _google(item: Dict[str, Any]) -> Post:
+    return Post(
+        id=_str(item.get("url")),
+        platform="google",
+        author=_str(item.get("displayedUrl")),
+        text=" ".join(filter(None, (item.get("title"), item.get("description")))),
+        timestamp=_timestamp(item.get("date")),
+        url=_str(item.get("url")),
+    )
+
+
+NORMALIZERS: Dict[str, Callable[[Dict[str, Any]], Post]] = {
+    "facebook": _facebook,
+    "tiktok": _tiktok,
+    "twitter": _twitter,
+    "instagram": _instagram,
+    "youtube": _youtube,
+    "google": _google,
+}
+
+NESTED_KEYS: Dict[str, Tuple[str, ...]] = {
+    "instagram": ("topPosts", "latestPosts"),
+    "google": ("organicResults",),
+}
+
+
+def flatten(platform: str, items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if (keys := NESTED_KEYS.get(platform)) is None:
+        return list(items)
+    return list(chain.from_iterable(item.get(key) or [] for item in items for key in keys))
+
+
+def normalize(platform: str, items: Iterable[Dict[str, Any]]) -> List[Post]:
+    if (normalizer := NORMALIZERS.get(platform)) is None:
+        raise ValueError(f"Unknown platform: {platform}")
+
+    posts = []
+    for item in flatten(platform, items):
+        post = normalizer(item)
+        if post.id:
+            posts.append(post)
+    return posts
@@ -0,0 +1,112 @@
+import hmac
+import importlib.util
+import logging
+import re
+import time
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from fastapi import FastAPI
+
+from src.services.config.profiling import settings
+
+_log = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile-token"
+PROFILE_QUERY = "__profile"
+
+MEDIA_TYPES = {"html": "text/html; charset=utf-8", "speedscope": "application/json"}
+EXTENSIONS = {"html": "html", "speedscope": "speedscope.json"}
+
+
+def _token(scope) -> str:
+    for name, value in scope["headers"]:
+        if name == PROFILE_HEADER:
+            return value.decode("latin-1")
+    if PROFILE_QUERY.encode() in scope["query_string"]:
+        return parse_qs(scope["query_string"].decode("latin-1")).get(PROFILE_QUERY, [""])[0]
+    return ""
+
+
+def _render(profiler) -> str:
+    from pyinstrument import renderers
+
+    renderer = renderers.SpeedscopeRenderer() if settings.PROFILING_FORMAT == "speedscope" else renderers.HTMLRenderer()
+    return profiler.output(renderer)
+
+
+def _store(scope, profile: str) -> Path:
+    directory = Path(settings.PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    route = re.sub(r"[^\w-]+", "_", getattr(scope.get("route"), "path", scope["path"])).strip("_") or "root"
+    name = f"{time.strftime('%Y%m%dT%H%M%S')}-{scope['method'].lower()}-{route}"
+    path = directory / f"{name}.{EXTENSIONS[settings.PROFILING_FORMAT]}"
+    path.write_text(profile, encoding="utf-8")
+    return path
+
+
+class ProfilingMiddleware:
+    """
+    Profile a single request carrying the profiling token in the X-Profile-Token header or the __profile
+    query parameter, with a sampling profiler. Other requests only pay for the token lookup.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not (token := _token(scope)):
+            return await self.app(scope, receive, send)
+        if not hmac.compare_digest(token.encode(), settings.PROFILING_TOKEN.encode()):
+            _log.warning(f"Rejected profiling request on {scope['path']}: invalid token")
+            return await self.app(scope, receive, send)
+
+        from pyinstrument import Profiler
+
+        profiler = Profiler(interval=settings.PROFILING_INTERVAL, async_mode="enabled")
+        replace = settings.PROFILING_OUTPUT == "response"
+        status_code = 500
+
+        async def capture(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            # The original response is dropped when the profile is returned instead
+            if not replace:
+                await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, capture)
+        except Exception:
+            if not replace:
+                raise
+            # The profile of a failing request is still returned
+            _log.exception(f"Profiled request {scope['method']} {scope['path']} failed")
+        finally:
+            profiler.stop()
+            profile = _render(profiler)
+            if replace:
+                await self._send_profile(send, profile, status_code)
+            else:
+                _log.info(f"Profile of {scope['method']} {scope['path']} stored in {_store(scope, profile)}")
+
+    @staticmethod
+    async def _send_profile(send, profile: str, status_code: int):
+        body = profile.encode("utf-8")
+        headers = [
+            (b"content-type", MEDIA_TYPES[settings.PROFILING_FORMAT].encode()),
+            (b"content-length", str(len(body)).encode()),
+            (b"x-profiled-status", str(status_code).encode()),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def setup_profiling(app: FastAPI):
+    if settings.PROFILING_TOKEN is None:
+        return
+    if importlib.util.find_spec("pyinstrument") is None:
+        _log.warning("PROFILING_TOKEN is set but pyinstrument is not installed, request profiling is disabled")
+        return
+    app.add_middleware(ProfilingMiddleware)
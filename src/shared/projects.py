@@ -0,0 +1,209 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import sentry_sdk
+from beanie import PydanticObjectId
+from pymongo import DESCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+from slugify import slugify
+
+from src.services import models, schemas
+from src.services.config.project import settings
+from .cache import TTLCache
+from .error_codes import YimbaApifyErrorCode
+from .text import edge_ngrams, EDGE_NGRAM_MAX_SIZE
+
+DUPLICATE_KEY = 11000
+
+# (slug, user id or None) -> whether a matching project exists
+existence: TTLCache[Tuple[str, Optional[str]], bool] = TTLCache(
+    maxsize=settings.PROJECT_CACHE_SIZE, ttl=settings.PROJECT_CACHE_TTL, name="project_existence"
+)
+
+
+def _error(name: str, code: YimbaApifyErrorCode, message: str) -> schemas.ProjectError:
+    return schemas.ProjectError(name=name, code=code, message=message)
+
+
+def _batches(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def split_names(value: str) -> List[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def _json_name(index: int, item: Any) -> str:
+    if isinstance(item, dict):
+        item = item.get("name", "")
+    if not isinstance(item, str):
+        raise ValueError(f"Item {index} is not a project name")
+    return item
+
+
+def read_names(data: bytes, filename: str = "", content_type: str = "") -> List[str]:
+    """
+    Project names from an uploaded JSON array (of names or {"name": ...} objects) or CSV file (first column).
+    """
+
+    if content_type == "application/json" or filename.lower().endswith(".json"):
+        items = json.loads(data)
+        if not isinstance(items, list):
+            raise ValueError("Expected a JSON array of project names")
+        names = (_json_name(index, item) for index, item in enumerate(items))
+    else:
+        reader = csv.reader(io.StringIO(data.decode("utf-8-sig"), newline=""))
+        names = (row[0] for row in reader if row)
+
+    names = [name.strip() for name in names if name and name.strip()]
+    if names and names[0].lower() == "name":
+        names = names[1:]
+    return names
+
+
+async def project_exists(slug: str, user: Optional[str] = None) -> bool:
+    if (exists := existence.get((slug, user))) is not None:
+        return exists
+
+    query = {"slug": slug}
+    if user:
+        query["user._id"] = user
+    exists = await models.Project.find_one(query).exists()
+
+    # Other worker processes are not told about changes: both answers are only kept for a few seconds
+    existence.set((slug, user), exists, ttl=None if exists else settings.PROJECT_NEGATIVE_CACHE_TTL)
+    return exists
+
+
+def forget_project(project: models.Project):
+    """
+    Drop the cached existence checks of a project after it is created, updated or deleted, in this process only.
+    """
+
+    existence.pop((project.slug, None))
+    if user := (project.user or {}).get("_id"):
+        existence.pop((project.slug, user))
+
+
+async def prepare_projects(
+    names: List[str], user: Dict[str, Any]
+) -> Tuple[List[models.Project], List[schemas.ProjectError]]:
+    """
+    Build the projects to insert, rejecting empty, duplicated and already used slugs with a single query per batch.
+    """
+
+    errors, slugs = [], {}
+    for name in names:
+        slug = slugify(name)
+        if not slug:
+            errors.append(_error(name, YimbaApifyErrorCode.VALUE_ERROR, "Project name produces an empty slug"))
+        elif slug in slugs:
+            errors.append(_error(name, YimbaApifyErrorCode.PARAMETER_CONFLICT, f"'{slug}' is duplicated in request"))
+        else:
+            slugs[slug] = name
+
+    collection = models.Project.get_motor_collection()
+    for batch in _batches(list(slugs), settings.PROJECT_BULK_BATCH_SIZE):
+        async for doc in collection.find({"slug": {"$in": batch}}, {"_id": 0, "slug": 1}):
+            name = slugs.pop(doc["slug"])
+            errors.append(
+                _error(name, YimbaApifyErrorCode.DOCUMENT_ALREADY_EXISTS, f"Project '{doc['slug']}' already exists")
+            )
+
+    now = datetime.now()
+    projects = [
+        models.Project(
+            id=PydanticObjectId(),
+            name=name,
+            slug=slug,
+            search_terms=search_terms(name),
+            user=user,
+            created_at=now,
+            updated_at=now,
+        )
+        for slug, name in slugs.items()
+    ]
+    return projects, errors
+
+
+async def insert_projects(projects: List[models.Project]) -> Tuple[List[models.Project], List[schemas.ProjectError]]:
+    """
+    Insert prepared projects with one unordered insert_many per batch. Slugs taken concurrently are reported
+    per item instead of failing the whole batch.
+    """
+
+    created, errors = [], []
+    for batch in _batches(projects, settings.PROJECT_BULK_BATCH_SIZE):
+        try:
+            with sentry_sdk.start_span(op="db.bulk_write", name="projects") as span:
+                span.set_data("operations", len(batch))
+                await models.Project.insert_many(batch, ordered=False)
+        except BulkWriteError as exc:
+            failed = {}
+            for write_error in exc.details.get("writeErrors", []):
+                project = batch[write_error["index"]]
+                if write_error.get("code") == DUPLICATE_KEY:
+                    code, message = (
+                        YimbaApifyErrorCode.DOCUMENT_ALREADY_EXISTS,
+                        f"Project '{project.slug}' already exists",
+                    )
+                else:
+                    code, message = YimbaApifyErrorCode.VALUE_ERROR, write_error.get("errmsg", "Insert failed")
+                failed[write_error["index"]] = _error(project.name, code, message)
+            errors.extend(failed.values())
+            created.extend(project for index, project in enumerate(batch) if index not in failed)
+        else:
+            created.extend(batch)
+
+    for project in created:
+        forget_project(project)
+    return created, errors
+
+
+async def create_projects(
+    names: List[str], user: Dict[str, Any]
+) -> Tuple[List[models.Project], List[schemas.ProjectError]]:
+    projects, errors = await prepare_projects(names, user)
+    created, insert_errors = await insert_projects(projects)
+    return created, errors + insert_errors
+
+
+def search_terms(name: str) -> List[str]:
+    return edge_ngrams(slugify(name))
+
+
+async def suggest_projects(prefix: str, user: Optional[str], limit: int = 10) -> List[schemas.ProjectSuggestion]:
+    """
+    Most recent projects of a user whose name or one of its words starts with the prefix.
+    """
+
+    # Never search across users: no user id, no suggestion
+    if not user or not (term := slugify(prefix)[:EDGE_NGRAM_MAX_SIZE]):
+        return []
+
+    query = {"search_terms": term, "user._id": user}
+    cursor = models.Project.get_motor_collection().find(
+        query, {"name": 1, "slug": 1}, sort=[("created_at", DESCENDING)], limit=limit
+    )
+    return [schemas.ProjectSuggestion(id=str(doc["_id"]), name=doc["name"], slug=doc["slug"]) async for doc in cursor]
+
+
+async def backfill_search_terms() -> int:
+    """
+    Compute the autocomplete terms of projects created before they existed.
+    """
+
+    collection = models.Project.get_motor_collection()
+    operations = [
+        UpdateOne({"_id": doc["_id"]}, {"$set": {"search_terms": search_terms(doc["name"])}})
+        async for doc in collection.find({"search_terms": {"$exists": False}}, {"name": 1})
+    ]
+    for batch in _batches(operations, settings.PROJECT_BULK_BATCH_SIZE):
+        with sentry_sdk.start_span(op="db.bulk_write", name="project search terms") as span:
+            span.set_data("operations", len(batch))
+            await collection.bulk_write(batch, ordered=False)
+    return len(operations)
@@ -0,0 +1,105 @@
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+import sentry_sdk
+from fastapi import Request, Response, status
+
+from src.services.config.render import settings
+from . import renderers
+from .cache import LRUCache
+
+_log = logging.getLogger(__name__)
+
+
+class RenderPool:
+    """
+    Pool of pre-warmed worker processes for CPU heavy rendering (word clouds,
+    charts), so it never runs on the event loop.
+    """
+
+    def __init__(self, workers: int, cache_size: int):
+        self.workers = workers
+        self.cache: LRUCache[str, bytes] = LRUCache(cache_size, name="rendered_images")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def start(self):
+        if self._executor is not None:
+            return
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=renderers.warm,
+            initargs=(settings.CLOUDTAGS_FONT_PATH, settings.CLOUDTAGS_MASK_PATH),
+        )
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._executor, renderers.ping) for _ in range(self.workers)))
+        _log.info(f"--> Render pool started with {self.workers} workers !")
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def key(func: Callable[..., bytes], **kwargs) -> str:
+        payload = json.dumps([func.__name__, kwargs], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def render(self, func: Callable[..., bytes], cache: bool = True, **kwargs) -> Tuple[str, bytes]:
+        key = self.key(func, **kwargs)
+        if cache and (image := self.cache.get(key)) is not None:
+            return key, image
+
+        # Identical renders requested concurrently share the same job
+        if (pending := self._pending.get(key)) is not None:
+            return key, await asyncio.shield(pending)
+
+        await self.start()
+        future = asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(func, **kwargs))
+        self._pending[key] = future
+        # Completed by the job itself, so a cancelled caller neither cancels nor forgets the shared render
+        future.add_done_callback(functools.partial(self._finish, key, cache))
+        with sentry_sdk.start_span(op="render.image", name=func.__name__):
+            image = await asyncio.shield(future)
+        return key, image
+
+    def _finish(self, key: str, cache: bool, future: asyncio.Future):
+        self._pending.pop(key, None)
+        if cache and not future.cancelled() and future.exception() is None:
+            self.cache.set(key, future.result())
+
+
+pool = RenderPool(workers=settings.RENDER_WORKERS, cache_size=settings.RENDER_CACHE_SIZE)
+
+
+async def startup_render_pool():
+    await pool.start()
+
+
+async def shutdown_render_pool():
+    pool.shutdown()
+    _log.info("--> Render pool closed !")
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    # Images are rendered from project data behind auth: browsers only, never shared caches
+    return {"ETag": f'"{etag}"', "Cache-Control": f"private, max-age={settings.RENDER_CACHE_MAX_AGE}"}
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match", "")
+    return any(tag.strip().removeprefix("W/").strip('"') in (etag, "*") for tag in if_none_match.split(",") if tag)
+
+
+def image_response(request: Request, etag: str, content: bytes, media_type: str = "image/png") -> Response:
+    if not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
+    return Response(content=content, media_type=media_type, headers=cache_headers(etag))
@@ -0,0 +1,76 @@
+# Functions executed inside the render worker processes. Every worker imports
+# this module, so keep its imports light: heavy libraries are loaded once by
+# ``warm`` when the worker starts.
+
+from io import BytesIO
+from typing import Dict, Optional
+
+_FONT_PATH: Optional[str] = None
+_MASK = None
+
+STYLES = {
+    "light": {"background_color": "white", "colormap": "viridis"},
+    "dark": {"background_color": "black", "colormap": "plasma"},
+}
+
+
+def warm(font_path: Optional[str] = None, mask_path: Optional[str] = None):
+    global _FONT_PATH, _MASK
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    import matplotlib.pyplot  # noqa: F401
+    import numpy as np
+    import wordcloud
+    from PIL import Image
+
+    _FONT_PATH = font_path or wordcloud.wordcloud.FONT_PATH
+    if mask_path:
+        with Image.open(mask_path) as image:
+            _MASK = np.array(image)
+
+
+def ping() -> bool:
+    return True
+
+
+def render_cloud(frequencies: Dict[str, int], width: int = 800, height: int = 400, style: str = "light") -> bytes:
+    from wordcloud import WordCloud
+
+    cloud = WordCloud(
+        width=width,
+        height=height,
+        font_path=_FONT_PATH,
+        mask=_MASK,
+        collocations=False,
+        **STYLES.get(style, STYLES["light"]),
+    )
+    cloud.generate_from_frequencies(frequencies)
+
+    buffer = BytesIO()
+    cloud.to_image().save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def render_pdf(html: str, base_url: Optional[str] = None) -> bytes:
+    from weasyprint import HTML
+
+    return HTML(string=html, base_url=base_url).write_pdf()
+
+
+def render_bar_chart(values: Dict[str, int], title: str = "", width: int = 800, height: int = 400) -> bytes:
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(width / 100, height / 100), dpi=100)
+    axes = figure.subplots()
+    axes.bar(list(values), list(values.values()), color="#4c72b0")
+    axes.set_title(title)
+    for container in axes.containers:
+        axes.bar_label(container)
+    figure.tight_layout()
+
+    buffer = BytesIO()
+    figure.savefig(buffer, format="png")
+    return buffer.getvalue()
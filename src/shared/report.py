@@ -0,0 +1,266 @@
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from fastapi import BackgroundTasks
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from slugify import slugify
+
+from src.services import models
+from src.services.config.report import settings
+from src.services.schemas import ReportState
+from . import renderers
+from .audience import summarize_audience
+from .cloudtags import to_data_uri, top_terms
+from .columnar import COUNTERS
+from .render import pool
+from .templating import STATIC_DIR, static_file_url, templates
+
+_log = logging.getLogger(__name__)
+
+
+async def platform_totals(platform: str, keyword: str) -> Dict[str, int]:
+    pipeline = [
+        {"$match": {"project": slugify(keyword)}},
+        {"$group": {"_id": None, **{name: {"$sum": f"$data.{name}"} for name in COUNTERS}}},
+    ]
+    collection = models.platform_models[platform].get_motor_collection()
+    async for doc in collection.aggregate(pipeline):
+        return {name: doc.get(name, 0) for name in COUNTERS}
+    return dict.fromkeys(COUNTERS, 0)
+
+
+class PlatformTotals:
+    """
+    Counter totals of the project per platform, aggregated once per report and shared by the sections reading them.
+    """
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def get(self, platform: str) -> Dict[str, int]:
+        if (task := self._tasks.get(platform)) is None:
+            task = self._tasks[platform] = asyncio.ensure_future(platform_totals(platform, self.keyword))
+        # A section timing out must not cancel the aggregation awaited by the other sections
+        return await asyncio.shield(task)
+
+    def close(self):
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Already reported by the sections awaiting it
+                task.exception()
+
+
+Section = Callable[[str, PlatformTotals], Awaitable[Dict[str, Any]]]
+
+
+def _statistic(prefix: str, totals: Dict[str, int]) -> Dict[str, int]:
+    return {f"{prefix}_total_{name}_count": value for name, value in totals.items()}
+
+
+async def fb_graphic(keyword: str, totals: PlatformTotals) -> Dict[str, Any]:
+    values = await totals.get("facebook")
+    _, image = await pool.render(renderers.render_bar_chart, values=values, title=keyword.upper())
+    return {"fb_graphic_img": to_data_uri(image)}
+
+
+async def get_fb_analyse(keyword: str, totals: PlatformTotals) -> Dict[str, Any]:
+    return _statistic("fb", await totals.get("facebook"))
+
+
+async def process_text_facebook(keyword: str, totals: PlatformTotals) -> Dict[str, Any]:
+    audience = await summarize_audience(keyword, platforms=["facebook"], top=20)
+    return {"fb_keywords": [item.term for item in audience.top_hashtags]}
+
+
+async def generate_cloud_tags_facebook(keyword: str, totals: PlatformTotals) -> Dict[str, Any]:
+    if not (frequencies := await top_terms(keyword, platform="facebook")):
+        return {}
+    _, image = await pool.render(renderers.render_cloud, frequencies=frequencies, width=800, height=400, style="light")
+    return {"fb_cloudtags_img": to_data_uri(image)}
+
+
+async def get_tiktok_analyse(keyword: str, totals: PlatformTotals) -> Dict[str, Any]:
+    return _statistic("tk", await totals.get("tiktok"))
+
+
+async def get_insta_analyse(keyword: str, totals: PlatformTotals) -> Dict[str, Any]:
+    return _statistic("in", await totals.get("instagram"))
+
+
+async def get_yt_analyse(keyword: str, totals: PlatformTotals) -> Dict[str, Any]:
+    return _statistic("yt", await totals.get("youtube"))
+
+
+SECTIONS: Tuple[Section, ...] = (
+    fb_graphic,
+    get_fb_analyse,
+    process_text_facebook,
+    generate_cloud_tags_facebook,
+    get_tiktok_analyse,
+    get_insta_analyse,
+    get_yt_analyse,
+)
+
+
+async def _run_section(section: Section, keyword: str, totals: PlatformTotals, timeout: float) -> Dict[str, Any] | None:
+    try:
+        return await asyncio.wait_for(section(keyword, totals), timeout=timeout)
+    except asyncio.TimeoutError:
+        _log.warning(f"Report section {section.__name__} timed out after {timeout}s for {keyword!r}")
+    except Exception as exc:
+        _log.exception(f"Report section {section.__name__} failed for {keyword!r}: {exc}")
+    return None
+
+
+async def build_report_context(keyword: str, timeout: float = settings.REPORT_SECTION_TIMEOUT) -> Dict[str, Any]:
+    """
+    Gather every report section concurrently. A section that fails or times
+    out is left out of the context and listed in ``missing_sections``.
+    """
+
+    totals = PlatformTotals(keyword)
+    try:
+        results = await asyncio.gather(*(_run_section(section, keyword, totals, timeout) for section in SECTIONS))
+    finally:
+        totals.close()
+
+    context: Dict[str, Any] = {}
+    missing: List[str] = []
+    for section, result in zip(SECTIONS, results):
+        if result is None:
+            missing.append(section.__name__)
+        else:
+            context.update(result)
+
+    context["missing_sections"] = missing
+    return context
+
+
+def _bucket() -> AsyncIOMotorGridFSBucket:
+    database = models.Report.get_motor_collection().database
+    return AsyncIOMotorGridFSBucket(database, bucket_name=settings.REPORT_BUCKET_NAME)
+
+
+async def report_key(keyword: str) -> Dict[str, Any]:
+    project = slugify(keyword)
+    doc = await models.Project.get_motor_collection().find_one({"slug": project}, {"data_version": 1})
+    return {
+        "project": project,
+        "data_version": (doc or {}).get("data_version", 0),
+        "template_version": templates.version,
+    }
+
+
+def _should_retry(doc: Dict[str, Any], now: datetime) -> bool:
+    if doc["status"] == ReportState.FAILED:
+        return True
+    expired = now - doc["updated_at"] > timedelta(seconds=settings.REPORT_JOB_TIMEOUT)
+    return doc["status"] == ReportState.PENDING and expired
+
+
+async def ensure_pdf_report(bg: BackgroundTasks, keyword: str) -> models.Report:
+    """
+    Return the PDF report of the current data and template versions,
+    scheduling its generation when it does not exist yet.
+    """
+
+    key = await report_key(keyword)
+    collection = models.Report.get_motor_collection()
+    now = datetime.now()
+
+    try:
+        previous = await collection.find_one_and_update(
+            key,
+            {"$setOnInsert": {"status": ReportState.PENDING, "created_at": now, "updated_at": now}},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE,
+        )
+        schedule = previous is None
+    except DuplicateKeyError:
+        previous, schedule = None, False
+
+    if previous is not None and _should_retry(previous, now):
+        result = await collection.update_one(
+            {"_id": previous["_id"], "status": previous["status"], "updated_at": previous["updated_at"]},
+            {"$set": {"status": ReportState.PENDING, "error": None, "updated_at": now}},
+        )
+        schedule = result.modified_count == 1
+
+    if schedule:
+        bg.add_task(generate_pdf_report, keyword, key)
+
+    return await models.Report.find_one(key)
+
+
+async def generate_pdf_report(keyword: str, key: Dict[str, Any]):
+    collection = models.Report.get_motor_collection()
+
+    try:
+        context = await build_report_context(keyword)
+        context.update(
+            {
+                "page_title": keyword.upper(),
+                "background_url": static_file_url("img/bg.png"),
+                "logo_url": static_file_url("img/logo.png"),
+            }
+        )
+        html = templates.render_report(context)
+
+        _, pdf = await pool.render(renderers.render_pdf, cache=False, html=html, base_url=str(STATIC_DIR.resolve()))
+        filename = f"{key['project']}-{key['data_version']}-{key['template_version']}.pdf"
+        file_id = await _bucket().upload_from_stream(filename, pdf, metadata=key)
+    except Exception as exc:
+        _log.exception(f"PDF report generation failed for {keyword!r}: {exc}")
+        await collection.update_one(
+            key, {"$set": {"status": ReportState.FAILED, "error": str(exc), "updated_at": datetime.now()}}
+        )
+        return
+
+    await collection.update_one(
+        key,
+        {
+            "$set": {
+                "status": ReportState.READY,
+                "file_id": file_id,
+                "etag": hashlib.sha256(pdf).hexdigest(),
+                "size": len(pdf),
+                "error": None,
+                "updated_at": datetime.now(),
+            }
+        },
+    )
+    await purge_stale_reports(key)
+
+
+async def purge_stale_reports(key: Dict[str, Any]):
+    collection = models.Report.get_motor_collection()
+    bucket = _bucket()
+    query = {
+        "project": key["project"],
+        "status": {"$ne": ReportState.PENDING},
+        "$or": [
+            {"data_version": {"$ne": key["data_version"]}},
+            {"template_version": {"$ne": key["template_version"]}},
+        ],
+    }
+    async for doc in collection.find(query):
+        if doc.get("file_id"):
+            try:
+                await bucket.delete(doc["file_id"])
+            except NoFile:
+                pass
+        await collection.delete_one({"_id": doc["_id"]})
+
+
+async def read_pdf_report(report: models.Report) -> bytes:
+    stream = await _bucket().open_download_stream(report.file_id)
+    return await stream.read()
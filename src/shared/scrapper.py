@@ -1,10 +1,19 @@
+from functools import lru_cache
 from typing import Optional
 
-from apify_client import ApifyClient
-from newsapi import NewsApiClient
+import sentry_sdk
 from pydantic import PositiveInt
 
-from src.services.config.apify import settings
+from .metrics import ACTOR_DURATION, ACTOR_FAILURES, ACTOR_ITEMS
+
+ACTOR_SETTINGS = {
+    "tiktok": "APIFY_TIKTOK_ACTOR",
+    "google": "APIFY_GOOGLE_ACTOR",
+    "twitter": "APIFY_TWITTER_ACTOR",
+    "facebook": "APIFY_FACEBOOK_ACTOR",
+    "youtube": "APIFY_YOUTUBE_ACTOR",
+    "instagram": "APIFY_INSTAGRAM_ACTOR",
+}
 
 
 class SocialMediaScraper:
@@ -17,22 +26,44 @@ class SocialMediaScraper:
         return cls.__instance
 
     def _initialize(self):
+        # Imported here so services that never scrape do not load the clients
+        from apify_client import ApifyClient
+
+        from src.services.config.apify import settings
+
+        self.settings = settings
         self.client = ApifyClient(token=settings.APIFY_TOKEN)
-        self.newsapi = NewsApiClient(api_key=settings.NEWSAPI_KEY)
-        self.actors = {
-            "tiktok": self.client.actor(settings.APIFY_TIKTOK_ACTOR),
-            "google": self.client.actor(settings.APIFY_GOOGLE_ACTOR),
-            "twitter": self.client.actor(settings.APIFY_TWITTER_ACTOR),
-            "facebook": self.client.actor(settings.APIFY_FACEBOOK_ACTOR),
-            "youtube": self.client.actor(settings.APIFY_YOUTUBE_ACTOR),
-            "instagram": self.client.actor(settings.APIFY_INSTAGRAM_ACTOR),
-        }
+        self.actors = {}
+        self._newsapi = None
+
+    def actor(self, actor_name: str):
+        if actor_name not in self.actors:
+            self.actors[actor_name] = self.client.actor(getattr(self.settings, ACTOR_SETTINGS[actor_name]))
+        return self.actors[actor_name]
+
+    @property
+    def newsapi(self):
+        if self._newsapi is None:
+            from newsapi import NewsApiClient
+
+            self._newsapi = NewsApiClient(api_key=self.settings.NEWSAPI_KEY)
+        return self._newsapi
 
     async def _run_actor(self, actor_name: str, run_input: dict):
-        result = self.actors[actor_name].call(run_input=run_input)
-        if result["status"] != "SUCCEEDED":
-            raise RuntimeError(f"The {actor_name} scraper run has failed")
-        return self.client.dataset(result["defaultDatasetId"]).list_items().items
+        with sentry_sdk.start_span(op="apify.actor", name=actor_name) as span:
+            with ACTOR_DURATION.time(actor_name, "submit"), span.start_child(op="apify.submit"):
+                run = self.actor(actor_name).start(run_input=run_input)
+            with ACTOR_DURATION.time(actor_name, "wait"), span.start_child(op="apify.wait"):
+                result = self.client.run(run["id"]).wait_for_finish() or run
+            span.set_data("status", result["status"])
+            if result["status"] != "SUCCEEDED":
+                ACTOR_FAILURES.inc(actor_name)
+                raise RuntimeError(f"The {actor_name} scraper run has failed")
+            with ACTOR_DURATION.time(actor_name, "dataset"), span.start_child(op="apify.dataset"):
+                items = self.client.dataset(result["defaultDatasetId"]).list_items().items
+            span.set_data("items", len(items))
+        ACTOR_ITEMS.observe(len(items), actor_name)
+        return items
 
     async def scrape_facebook(self, keyword: str, results_limit: Optional[PositiveInt] = 20):
         run_input = {"keywordList": [keyword], "resultsLimit": results_limit}
@@ -103,4 +134,6 @@ class SocialMediaScraper:
         return result.get("articles")
 
 
-scraper = SocialMediaScraper()
+@lru_cache
+def get_scraper() -> SocialMediaScraper:
+    return SocialMediaScraper()
@@ -0,0 +1,149 @@
+import heapq
+import re
+from hashlib import blake2b
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .text import MENTION_PATTERN
+
+MENTION_MAX_LENGTH = 30
+HASHTAG_PATTERN = re.compile(r"(?<![\w#])#(\w{2,50})")
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct counter, ~1.6% standard error with the default precision.
+    """
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = 12, registers: Optional[bytes] = None):
+        self.precision = precision
+        size = 1 << precision
+        if registers is None:
+            self.registers = np.zeros(size, dtype=np.uint8)
+        else:
+            self.registers = np.frombuffer(registers, dtype=np.uint8).copy()
+            if self.registers.size != size:
+                raise ValueError("Register size does not match precision")
+
+    def add(self, value: str):
+        h = _hash64(value)
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, values: Iterable[str]):
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog with different precisions")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> int:
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int32)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+    def to_bytes(self) -> bytes:
+        return self.registers.tobytes()
+
+
+class CountMinSketch:
+    __slots__ = ("width", "depth", "table")
+
+    def __init__(self, width: int = 1024, depth: int = 4, table: Optional[bytes] = None):
+        self.width = width
+        self.depth = depth
+        if table is None:
+            self.table = np.zeros((depth, width), dtype=np.uint32)
+        else:
+            self.table = np.frombuffer(table, dtype=np.uint32).reshape(depth, width).copy()
+
+    def _indexes(self, item: str) -> np.ndarray:
+        digest = blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big") | 1
+        return np.array([(h1 + i * h2) % self.width for i in range(self.depth)])
+
+    def add(self, item: str, count: int = 1) -> int:
+        indexes = self._indexes(item)
+        rows = np.arange(self.depth)
+        self.table[rows, indexes] += count
+        return int(self.table[rows, indexes].min())
+
+    def estimate(self, item: str) -> int:
+        return int(self.table[np.arange(self.depth), self._indexes(item)].min())
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge CountMinSketch with different dimensions")
+        self.table += other.table
+        return self
+
+    def to_bytes(self) -> bytes:
+        return self.table.tobytes()
+
+
+class HeavyHitters:
+    """
+    Top-k frequent items: a count-min sketch for the frequencies and a bounded
+    set of candidates pruned with a heap.
+    """
+
+    __slots__ = ("capacity", "sketch", "candidates")
+
+    def __init__(
+        self,
+        capacity: int = 50,
+        sketch: Optional[CountMinSketch] = None,
+        candidates: Optional[Dict[str, int]] = None,
+    ):
+        self.capacity = capacity
+        self.sketch = sketch or CountMinSketch()
+        self.candidates = dict(candidates or {})
+
+    def add(self, item: str, count: int = 1):
+        self.candidates[item] = self.sketch.add(item, count)
+        if len(self.candidates) > 2 * self.capacity:
+            self._prune()
+
+    def update(self, items: Iterable[str]):
+        for item in items:
+            self.add(item)
+
+    def _prune(self):
+        self.candidates = dict(heapq.nlargest(self.capacity, self.candidates.items(), key=lambda kv: kv[1]))
+
+    def merge(self, other: "HeavyHitters") -> "HeavyHitters":
+        self.sketch.merge(other.sketch)
+        keys = self.candidates.keys() | other.candidates.keys()
+        self.candidates = {key: self.sketch.estimate(key) for key in keys}
+        self._prune()
+        return self
+
+    def top(self, k: int = 10) -> List[Tuple[str, int]]:
+        return heapq.nlargest(k, self.candidates.items(), key=lambda kv: kv[1])
+
+
+def extract_mentions(text: str) -> List[str]:
+    return [
+        mention.lower() for mention in MENTION_PATTERN.findall(text or "") if 2 <= len(mention) <= MENTION_MAX_LENGTH
+    ]
+
+
+def extract_hashtags(text: str) -> List[str]:
+    return [tag.lower() for tag in HASHTAG_PATTERN.findall(text or "")]
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import sentry_sdk
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+
+from src.services.config.report import settings
+from .cache import LRUCache
+
+_log = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path("src/templates")
+STATIC_DIR = Path("src/static")
+
+REPORT_LAYOUT = "pdf/pdf.html"
+
+PLATFORM_STATISTICS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("fb", "#CollectFacebookData", ("likes", "shares", "views", "comments")),
+    ("tk", "#CollecteTiktokData", ("likes", "shares", "views", "comments")),
+    ("yt", "#CollectYoutubeData", ("likes", "shares", "views", "comments")),
+    ("in", "#CollecteInstagramData", ("likes", "comments")),
+)
+COUNTER_LABELS = {"likes": "likes", "shares": "partages", "views": "vues", "comments": "commentaires"}
+SECTION_LABELS = {
+    "fb_graphic": "Graphique Facebook",
+    "get_fb_analyse": "Statistiques Facebook",
+    "process_text_facebook": "Hashtags Facebook",
+    "generate_cloud_tags_facebook": "Nuage de mots Facebook",
+    "get_tiktok_analyse": "Statistiques TikTok",
+    "get_insta_analyse": "Statistiques Instagram",
+    "get_yt_analyse": "Statistiques YouTube",
+}
+
+
+def _mentions(context: Dict[str, Any]) -> Dict[str, Any]:
+    platforms = [
+        {
+            "title": title,
+            "counters": [
+                {"value": context.get(f"{prefix}_total_{name}_count", ""), "label": COUNTER_LABELS[name]}
+                for name in counters
+            ],
+        }
+        for prefix, title, counters in PLATFORM_STATISTICS
+    ]
+    return {"platforms": platforms}
+
+
+def _missing(context: Dict[str, Any]) -> Dict[str, Any]:
+    return {"missing_sections": [SECTION_LABELS.get(name, name) for name in context.get("missing_sections", [])]}
+
+
+def _pick(*keys: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    return lambda context: {key: context[key] for key in keys if key in context}
+
+
+# Each section only sees the part of the report context it renders, so its
+# cached fragment stays valid while other sections change.
+REPORT_SECTIONS: Sequence[Tuple[str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = (
+    ("pdf/sections/header.html", _pick("page_title", "background_url")),
+    ("pdf/sections/missing.html", _missing),
+    ("pdf/sections/graphic.html", _pick("page_title", "fb_graphic_img")),
+    ("pdf/sections/mentions.html", _mentions),
+    ("pdf/sections/cloudtags.html", _pick("page_title", "fb_cloudtags_img")),
+    ("pdf/sections/hashtags.html", _pick("fb_keywords")),
+    ("pdf/sections/footer.html", _pick("logo_url")),
+)
+
+
+class ReportTemplates:
+    """
+    Jinja environment compiled once at startup, rendering reports section by
+    section with each fragment cached by a hash of its data.
+    """
+
+    def __init__(self, directory: Path, cache_size: int):
+        self.directory = directory
+        self.env = Environment(
+            loader=FileSystemLoader(str(directory)),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=False,
+            cache_size=-1,
+        )
+        self.version = self._version()
+        self.fragments: LRUCache[str, Markup] = LRUCache(cache_size, name="report_fragments")
+
+    def _version(self) -> str:
+        digest = hashlib.sha256()
+        for path in sorted(self.directory.rglob("*.html")):
+            digest.update(path.relative_to(self.directory).as_posix().encode("utf-8"))
+            digest.update(path.read_bytes())
+        return digest.hexdigest()[:16]
+
+    def compile(self):
+        names = self.env.list_templates(extensions=["html"])
+        for name in names:
+            self.env.get_template(name)
+        _log.info(f"--> {len(names)} templates compiled !")
+
+    def _key(self, name: str, context: Dict[str, Any]) -> str:
+        payload = json.dumps([self.version, name, context], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def render_fragment(self, name: str, context: Dict[str, Any]) -> Markup:
+        key = self._key(name, context)
+        if (fragment := self.fragments.get(key)) is None:
+            with sentry_sdk.start_span(op="template.render", name=name):
+                fragment = Markup(self.env.get_template(name).render(context))
+            self.fragments.set(key, fragment)
+        return fragment
+
+    def render_report(self, context: Dict[str, Any]) -> str:
+        with sentry_sdk.start_span(op="template.render", name=REPORT_LAYOUT):
+            fragments: List[Markup] = [self.render_fragment(name, select(context)) for name, select in REPORT_SECTIONS]
+            return self.env.get_template(REPORT_LAYOUT).render(
+                page_title=context.get("page_title"), fragments=fragments
+            )
+
+
+templates = ReportTemplates(TEMPLATE_DIR, cache_size=settings.REPORT_FRAGMENT_CACHE_SIZE)
+
+
+def static_file_url(path: str) -> str:
+    # Offline rendering has no request: point static assets to local files
+    return (STATIC_DIR / path).resolve().as_uri()
+
+
+def compile_templates():
+    templates.compile()
@@ -0,0 +1,69 @@
+import re
+import unicodedata
+from collections import Counter
+from typing import Iterable, List
+
+URL_PATTERN = re.compile(r"https?://\S+|www\.\S+")
+# Dots are allowed inside a handle but never end it: "@john.doe." mentions "john.doe"
+MENTION_PATTERN = re.compile(r"(?<![\w@])@(\w+(?:\.\w+)*)")
+WORD_PATTERN = re.compile(r"[^\W\d_]{3,}(?:['’][^\W\d_]+)?")
+
+ENGLISH_STOPWORDS = frozenset(
+    """
+    about above after again against all also and any are aren't because been before being below between both but
+    can cannot could couldn't did didn't does doesn't doing don't down during each few for from further get had
+    hadn't has hasn't have haven't having her here here's hers herself him himself his how how's i'd i'll i'm i've
+    into isn't it's its itself just let's like more most mustn't myself nor not now off once only other ought our
+    ours ourselves out over own same shan't she she'd she'll she's should shouldn't since some such than that
+    that's the their theirs them themselves then there there's these they they'd they'll they're they've this those
+    through too under until very was wasn't we'd we'll we're we've were weren't what what's when when's where
+    where's which while who who's whom why why's will with won't would wouldn't you you'd you'll you're you've your
+    yours yourself yourselves amp via rt
+    """.split()
+)
+
+FRENCH_STOPWORDS = frozenset(
+    """
+    alors au aucun aucune aussi autre autres aux avec avoir avait avant bon car ce ceci cela celle celles celui
+    ces cet cette ceux chaque chez comme comment dans des depuis deux doit donc dont du elle elles en encore entre
+    est et été être eux fait faire fois font hors ici il ils je juste la le les leur leurs lui mais mes moi moins
+    mon même ni nos notre nous on ont ou où par parce pas peu peut plus pour pourquoi quand que quel quelle quelles
+    quels qui quoi sans ses seulement si sien son sont sous soyez sur ta tandis tellement tels tes ton tous tout
+    toute toutes très trop tu une vos votre vous vu ça était étaient sera seront avez avons suis sommes etes c'est
+    qu'il qu'elle n'est j'ai d'un d'une l'on aujourd'hui ceux-ci celui-ci
+    """.split()
+)
+
+STOPWORDS = ENGLISH_STOPWORDS | FRENCH_STOPWORDS
+
+EDGE_NGRAM_MAX_SIZE = 20
+
+
+def _fold(word: str) -> str:
+    return word.replace("’", "'")
+
+
+def tokenize(text: str) -> List[str]:
+    if not text:
+        return []
+    text = unicodedata.normalize("NFC", text.lower())
+    text = MENTION_PATTERN.sub(" ", URL_PATTERN.sub(" ", text))
+    return [word for word in map(_fold, WORD_PATTERN.findall(text)) if word not in STOPWORDS]
+
+
+def term_frequencies(texts: Iterable[str]) -> Counter:
+    counter = Counter()
+    for text in texts:
+        counter.update(tokenize(text))
+    return counter
+
+
+def edge_ngrams(slug: str, min_size: int = 1, max_size: int = EDGE_NGRAM_MAX_SIZE) -> List[str]:
+    """
+    Prefixes of a slug and of each of its words, used to serve search-as-you-type with an equality index.
+    """
+
+    grams = set()
+    for part in [slug, *slug.split("-")]:
+        grams.update(part[:size] for size in range(min_size, min(len(part), max_size) + 1))
+    return sorted(grams)
@@ -0,0 +1,41 @@
+import random
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+from src.services.config.sentry import settings
+
+# Probes hit by the orchestrator and Prometheus, never worth a trace
+UNTRACED_SUFFIXES = ("/@ping", "/@metrics")
+
+
+def _seconds(timestamp: Union[str, datetime]) -> float:
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return timestamp.timestamp()
+
+
+def traces_sampler(context: Dict[str, Any]) -> float:
+    """
+    Sample rate of a new transaction. With a slow threshold every transaction is recorded, the sample rate
+    being applied once its duration is known by `keep_slow_transactions`.
+    """
+
+    path = (context.get("asgi_scope") or {}).get("path", "")
+    if path.endswith(UNTRACED_SUFFIXES):
+        return 0.0
+    if (parent_sampled := context.get("parent_sampled")) is not None:
+        return float(parent_sampled)
+    if settings.SENTRY_SLOW_TRANSACTION_THRESHOLD is not None:
+        return 1.0
+    return settings.SENTRY_TRACES_SAMPLE_RATE
+
+
+def keep_slow_transactions(event: Dict[str, Any], hint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if settings.SENTRY_SLOW_TRANSACTION_THRESHOLD is None:
+        return event
+
+    duration = _seconds(event["timestamp"]) - _seconds(event["start_timestamp"])
+    if duration >= settings.SENTRY_SLOW_TRANSACTION_THRESHOLD:
+        event.setdefault("tags", {})["slow_transaction"] = "true"
+        return event
+    return event if random.random() < settings.SENTRY_TRACES_SAMPLE_RATE else None
@@ -1,22 +1,36 @@
+from datetime import datetime
 from enum import StrEnum
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import sentry_sdk
 from fastapi import BackgroundTasks, status
+from pymongo import UpdateOne
 from slugify import slugify
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 from src.common.helpers.exceptions import CustomHTTException
 from src.services import models, schemas
+from src.shared.audience import record_sketches
+from src.shared.cloudtags import index_terms
+from src.shared.columnar import PostBatch
 from src.shared.error_codes import YimbaApifyErrorCode
+from src.shared.metrics import SENTIMENT_DURATION, SENTIMENT_POSTS
+from src.shared.posts import Post
+from src.shared.projects import project_exists
 
-analyzer = SentimentIntensityAnalyzer()
+
+@lru_cache
+def get_analyzer():
+    # The VADER lexicon is only loaded by the services that score posts
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+    return SentimentIntensityAnalyzer()
 
 
 async def validate_project(keyword: str, user: Optional[str] = None):
-    query = {"slug": slugify(keyword)}
-    if user:
-        query["user._id"] = user
-    if not await models.Project.find_one(query).exists():
+    with sentry_sdk.start_span(op="yimba.validate_project", name=keyword):
+        exists = await project_exists(slugify(keyword), user)
+    if not exists:
         raise CustomHTTException(
             code_error=YimbaApifyErrorCode.DOCUMENT_NOT_FOUND,
             message_error=f"Project with name {keyword} not found",
@@ -35,7 +49,9 @@ async def analyze_data(bg: BackgroundTasks, post_id: str, text: str = ""):
     if await models.Analyse.find_one({"post_id": post_id}).exists():
         return
 
-    apc = analyzer.polarity_scores(text)
+    with SENTIMENT_DURATION.time(), sentry_sdk.start_span(op="yimba.sentiment", name="vader"):
+        apc = get_analyzer().polarity_scores(text)
+    SENTIMENT_POSTS.inc()
 
     analysis = schemas.CreateAnalyse(
         post_id=post_id,
@@ -48,6 +64,89 @@ async def analyze_data(bg: BackgroundTasks, post_id: str, text: str = ""):
     bg.add_task(save_analysis, analysis)
 
 
+def to_statistic(batch: PostBatch) -> schemas.CollectStatistic:
+    totals = batch.totals()
+    return schemas.CollectStatistic(
+        likesCount=totals["likes"],
+        sharesCount=totals["shares"],
+        viewsCount=totals["views"],
+        commentsCount=totals["comments"],
+    )
+
+
+def compute_statistic(posts: List[Post]) -> schemas.CollectStatistic:
+    return to_statistic(PostBatch.from_posts(posts))
+
+
+def _post_update(project: str, post: Post, now: datetime) -> List[Dict[str, Any]]:
+    # Unchanged posts are left untouched, so the modified count only reports posts whose data changed
+    data = {"$literal": post.to_dict()}
+    return [
+        {
+            "$set": {
+                "project": project,
+                "data": data,
+                "created_at": {"$ifNull": ["$created_at", now]},
+                "updated_at": {"$cond": [{"$eq": ["$data", data]}, "$updated_at", now]},
+            }
+        }
+    ]
+
+
+async def save_posts(platform: str, keyword: str, posts: List[Post]) -> Tuple[List[Post], bool]:
+    """
+    Upsert the posts of a project, returning the newly inserted ones and whether any stored post changed.
+    """
+
+    if not posts:
+        return [], False
+
+    project = slugify(keyword)
+    now = datetime.now()
+    operations = [
+        UpdateOne({"project": project, "data.id": post.id}, _post_update(project, post, now), upsert=True)
+        for post in posts
+    ]
+    with sentry_sdk.start_span(op="db.bulk_write", name=f"{platform} posts") as span:
+        span.set_data("operations", len(operations))
+        result = await models.platform_models[platform].get_motor_collection().bulk_write(operations, ordered=False)
+    new_posts = [posts[index] for index in sorted(result.upserted_ids)]
+    return new_posts, bool(result.upserted_count or result.modified_count)
+
+
+async def ingest_posts(platform: str, keyword: str, posts: List[Post]):
+    new_posts, changed = await save_posts(platform, keyword, posts)
+    if new_posts:
+        await record_sketches(platform, keyword, new_posts)
+        await index_terms(platform, keyword, new_posts)
+
+    # Refreshed counters of existing posts change the report as much as new posts
+    if changed:
+        await models.Project.get_motor_collection().update_many(
+            {"slug": slugify(keyword)}, {"$inc": {"data_version": 1}}
+        )
+
+
+async def load_posts(keyword: str, platforms: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    project = slugify(keyword)
+    records = []
+    for platform in platforms or models.platform_models:
+        collection = models.platform_models[platform].get_motor_collection()
+        records.extend([doc["data"] async for doc in collection.find({"project": project}, {"_id": 0, "data": 1})])
+    return records
+
+
+async def load_sentiments(post_ids: Sequence[str]) -> Dict[str, float]:
+    collection = models.Analyse.get_motor_collection()
+    cursor = collection.find({"post_id": {"$in": list(post_ids)}}, {"_id": 0, "post_id": 1, "compound": 1})
+    return {doc["post_id"]: doc["compound"] async for doc in cursor}
+
+
+async def load_batch(keyword: str, platforms: Optional[Sequence[str]] = None) -> PostBatch:
+    batch = PostBatch.from_records(await load_posts(keyword, platforms))
+    return batch.with_sentiments(await load_sentiments(batch.ids.tolist()))
+
+
 class SortEnum(StrEnum):
     ASC = "asc"
     DESC = "desc"
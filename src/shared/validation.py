@@ -0,0 +1,67 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from src.services import schemas
+
+_log = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@dataclass(frozen=True)
+class ItemError:
+    index: int
+    errors: List[Dict[str, Any]]
+
+
+class BatchValidator(Generic[M]):
+    """
+    Validate a whole dataset against a model in one call, dropping the invalid items instead of failing the batch.
+    """
+
+    def __init__(self, name: str, model: Type[M]):
+        self.name = name
+        self.model = model
+        self.adapter = TypeAdapter(List[model])
+
+    def validate(self, items: Sequence[Any]) -> Tuple[List[M], List[ItemError]]:
+        try:
+            return self.adapter.validate_python(items), []
+        except ValidationError as exc:
+            failed: Dict[int, List[Dict[str, Any]]] = {}
+            for error in exc.errors(include_url=False, include_input=False):
+                if not error["loc"]:
+                    # The dataset itself is not a list
+                    raise
+                index, *loc = error["loc"]
+                failed.setdefault(index, []).append({**error, "loc": tuple(loc)})
+
+        # A second pass over the remaining items, known to be valid
+        valid = self.adapter.validate_python([item for index, item in enumerate(items) if index not in failed])
+        errors = [ItemError(index=index, errors=item_errors) for index, item_errors in sorted(failed.items())]
+        return valid, errors
+
+    def dump(self, items: List[M]) -> List[Dict[str, Any]]:
+        return self.adapter.dump_python(items, mode="json")
+
+    def clean(self, items: Sequence[Any]) -> List[Dict[str, Any]]:
+        """
+        JSON compatible dicts of the valid items, ready for `crud.paginate_trusted`.
+        """
+
+        valid, errors = self.validate(items)
+        if errors:
+            _log.warning(
+                f"Dropped {len(errors)}/{len(items)} invalid {self.name} items, first at index {errors[0].index}: "
+                f"{errors[0].errors[0]['msg']} ({'.'.join(map(str, errors[0].errors[0]['loc']))})"
+            )
+        return self.dump(valid)
+
+
+# Compiled once per process, by platform
+validators: Dict[str, BatchValidator] = {
+    "facebook": BatchValidator("facebook", schemas.FacebookResponse),
+}
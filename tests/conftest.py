@@ -0,0 +1,83 @@
+import os
+from collections import Counter
+
+import httpx
+import pytest
+
+# Settings are read at import time: provide the required values when the test environment does not define them
+for name, value in {
+    "PROJECT_MODEL_NAME": "projects",
+    "ANALYSE_MODEL_NAME": "analyses",
+    "API_AUTH_URL_BASE": "http://auth.test",
+    "CHECK_ACCESS_URL": "/check-access",
+    "CHECK_USERINFO_URL": "/userinfo",
+    "AUTH_JWKS_URL": "http://auth.test/.well-known/jwks.json",
+    "PERMS_DB_COLLECTION": "permissions",
+    "APP_DESC_DB_COLLECTION": "appdesc",
+    "MONGO_DB": "yimba-test",
+    "MONGODB_URI": "mongodb://localhost:27017",
+    "MONGO_PORT": "27017",
+    "MONGO_USER": "yimba",
+    "MONGO_PASSWORD": "yimba",
+    "SENTRY_DSN": "",
+    "SENTRY_RELEASE": "test",
+    "SENTRY_ENVIRONMENT": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class AuthService:
+    """
+    Fake auth service answering the token introspection, the access checks and the JWKS endpoint.
+    """
+
+    def __init__(self, userinfo=None, access=None, status_code=200, content=None, jwks=None):
+        from src.services.config.auth import settings
+        from src.shared.url_patterns import CHECK_USERINFO_URL
+
+        self.userinfo_url, self.jwks_url = CHECK_USERINFO_URL, settings.AUTH_JWKS_URL
+        self.userinfo = userinfo or {"active": True, "user_info": {"_id": "remote-user"}}
+        self.access = {"access": True} if access is None else access
+        self.status_code = status_code
+        self.content = content
+        self.jwks = jwks
+        self.calls = Counter()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url.copy_with(query=None))
+        self.calls[url] += 1
+        if url == self.userinfo_url:
+            return httpx.Response(200, json=self.userinfo)
+        if url == self.jwks_url:
+            return httpx.Response(200, json=self.jwks) if self.jwks is not None else httpx.Response(404)
+        if self.content is not None:
+            return httpx.Response(self.status_code, content=self.content)
+        return httpx.Response(self.status_code, json=self.access)
+
+
+@pytest.fixture
+def auth_service(monkeypatch):
+    """
+    Install a fresh AuthService behind the shared HTTP client, with empty auth caches.
+    """
+
+    from src.shared import auth_handler
+    from src.shared.auth_handler import CheckPermissions, CheckUserInfoHandler, KeySet
+
+    for cache in (CheckUserInfoHandler.cache, CheckPermissions.permission_sets, CheckPermissions.decisions):
+        cache.clear()
+    keys = KeySet(url=auth_handler.settings.AUTH_JWKS_URL, refresh=auth_handler.settings.AUTH_JWKS_REFRESH)
+    monkeypatch.setattr(CheckUserInfoHandler, "keys", keys)
+
+    def install(**kwargs) -> AuthService:
+        service = AuthService(**kwargs)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(service))
+        monkeypatch.setattr(auth_handler, "get_http_client", lambda: client)
+        return service
+
+    return install
@@ -0,0 +1,142 @@
+import time
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.common.helpers.exceptions import CustomHTTException
+from src.shared import auth_handler
+from src.shared.auth_handler import CheckUserInfoHandler, token_key
+from src.shared.url_patterns import CHECK_USERINFO_URL
+
+pytestmark = pytest.mark.anyio
+
+JWKS_URL = auth_handler.settings.AUTH_JWKS_URL
+KID = "signing-key"
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def sign(private_key, kid=KID, **claims) -> str:
+    claims = {"sub": "user-1", "exp": int(time.time()) + 600, **claims}
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture(scope="module")
+def jwks(private_key):
+    public_jwk = jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    return {"keys": [{**public_jwk, "kid": KID, "use": "sig", "alg": "RS256"}]}
+
+
+@pytest.fixture
+def local_mode(monkeypatch):
+    monkeypatch.setattr(auth_handler.settings, "AUTH_VERIFY_MODE", "local")
+    monkeypatch.setattr(auth_handler.settings, "AUTH_REMOTE_FALLBACK", True)
+
+
+async def test_introspection_is_cached(auth_service):
+    service = auth_service()
+    handler = CheckUserInfoHandler()
+
+    await handler("Bearer opaque-token")
+    userinfo = await handler("Bearer opaque-token")
+
+    assert userinfo["user_info"]["_id"] == "remote-user"
+    assert service.calls[CHECK_USERINFO_URL] == 1
+
+
+async def test_inactive_token_is_rejected(auth_service):
+    auth_service(userinfo={"active": False})
+
+    with pytest.raises(CustomHTTException):
+        await CheckUserInfoHandler()("Bearer opaque-token")
+    assert len(CheckUserInfoHandler.cache) == 0
+
+
+async def test_token_is_not_cached_past_its_expiry(auth_service):
+    auth_service(userinfo={"active": True, "user_info": {"_id": "remote-user"}, "exp": time.time() + 5})
+    cache = CheckUserInfoHandler.cache
+
+    await CheckUserInfoHandler()("Bearer short-lived")
+
+    expires_at, _ = cache._items.get(token_key("short-lived"))
+    assert expires_at - time.monotonic() <= 5
+
+
+async def test_expired_token_is_not_cached(auth_service):
+    service = auth_service(userinfo={"active": True, "user_info": {"_id": "remote-user"}, "exp": time.time() - 1})
+
+    await CheckUserInfoHandler()("Bearer expired")
+    await CheckUserInfoHandler()("Bearer expired")
+
+    assert service.calls[CHECK_USERINFO_URL] == 2
+
+
+async def test_local_verification_skips_introspection(auth_service, jwks, local_mode, private_key):
+    service = auth_service(jwks=jwks)
+    token = sign(private_key, user_info={"_id": "local-user"})
+
+    userinfo = await CheckUserInfoHandler()(f"Bearer {token}")
+    await CheckUserInfoHandler()(f"Bearer {token}")
+
+    assert userinfo["active"] is True
+    assert userinfo["user_info"]["_id"] == "local-user"
+    assert service.calls[CHECK_USERINFO_URL] == 0
+    assert service.calls[JWKS_URL] == 1
+
+
+async def test_local_verification_defaults_user_info_to_subject(auth_service, jwks, local_mode, private_key):
+    auth_service(jwks=jwks)
+
+    userinfo = await CheckUserInfoHandler()(f"Bearer {sign(private_key)}")
+
+    assert userinfo["user_info"] == {"_id": "user-1"}
+
+
+@pytest.mark.parametrize("claims", [{"exp": int(time.time()) - 3600}, {"iss": "someone-else"}])
+async def test_local_verification_rejects_invalid_tokens(
+    auth_service, jwks, local_mode, monkeypatch, private_key, claims
+):
+    monkeypatch.setattr(auth_handler.settings, "AUTH_JWT_ISSUER", "auth.test")
+    service = auth_service(jwks=jwks)
+    token = sign(private_key, **{"iss": "auth.test", **claims})
+
+    with pytest.raises(CustomHTTException):
+        await CheckUserInfoHandler()(f"Bearer {token}")
+    assert service.calls[CHECK_USERINFO_URL] == 0
+
+
+async def test_local_verification_rejects_foreign_signature(auth_service, jwks, local_mode):
+    auth_service(jwks=jwks)
+    token = sign(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+
+    with pytest.raises(CustomHTTException):
+        await CheckUserInfoHandler()(f"Bearer {token}")
+
+
+async def test_opaque_token_falls_back_to_introspection(auth_service, jwks, local_mode):
+    service = auth_service(jwks=jwks)
+
+    userinfo = await CheckUserInfoHandler()("Bearer opaque-token")
+
+    assert userinfo["user_info"]["_id"] == "remote-user"
+    assert service.calls[CHECK_USERINFO_URL] == 1
+
+
+async def test_unknown_key_falls_back_to_introspection(auth_service, jwks, local_mode, private_key):
+    service = auth_service(jwks=jwks)
+
+    await CheckUserInfoHandler()(f"Bearer {sign(private_key, kid='rotated-key')}")
+
+    assert service.calls[CHECK_USERINFO_URL] == 1
+
+
+async def test_fallback_can_be_disabled(auth_service, jwks, local_mode, monkeypatch):
+    monkeypatch.setattr(auth_handler.settings, "AUTH_REMOTE_FALLBACK", False)
+    service = auth_service(jwks=jwks)
+
+    with pytest.raises(CustomHTTException):
+        await CheckUserInfoHandler()("Bearer opaque-token")
+    assert service.calls[CHECK_USERINFO_URL] == 0
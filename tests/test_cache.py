@@ -0,0 +1,57 @@
+import pytest
+
+from src.shared import cache
+from src.shared.cache import LRUCache, TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_ttl_cache_expires_entries(clock):
+    ttl_cache = TTLCache(maxsize=10, ttl=60)
+    ttl_cache.set("key", "value")
+
+    clock[0] += 59
+    assert ttl_cache.get("key") == "value"
+
+    clock[0] += 1
+    assert ttl_cache.get("key") is None
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_entry_ttl_is_capped_by_cache_ttl(clock):
+    ttl_cache = TTLCache(maxsize=10, ttl=60)
+    ttl_cache.set("short", "value", ttl=5)
+    ttl_cache.set("long", "value", ttl=600)
+
+    clock[0] += 5
+    assert ttl_cache.get("short") is None
+    assert ttl_cache.get("long") == "value"
+
+    clock[0] += 55
+    assert ttl_cache.get("long") is None
+
+
+def test_ttl_cache_skips_expired_values(clock):
+    ttl_cache = TTLCache(maxsize=10, ttl=60)
+    ttl_cache.set("key", "value", ttl=-1)
+
+    assert ttl_cache.get("key") is None
+    assert len(ttl_cache) == 0
+
+
+def test_lru_cache_evicts_least_recently_used():
+    lru_cache = LRUCache(maxsize=2)
+    lru_cache.set("a", 1)
+    lru_cache.set("b", 2)
+    assert lru_cache.get("a") == 1
+
+    lru_cache.set("c", 3)
+
+    assert lru_cache.get("b") is None
+    assert lru_cache.get("a") == 1
+    assert lru_cache.get("c") == 3
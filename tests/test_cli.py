@@ -0,0 +1,16 @@
+from src.cli.utils import production_options, worker_class
+from src.services.config import APIBaseSettings
+
+
+def test_worker_class_applies_uvicorn_options(monkeypatch):
+    monkeypatch.setenv("UVICORN_LIMIT_CONCURRENCY", "64")
+    options = production_options(APIBaseSettings(), workers=2)
+
+    config = worker_class(options).CONFIG_KWARGS
+
+    assert config["limit_concurrency"] == 64
+    assert (config["loop"], config["http"]) == (options["loop"], options["http"])
+
+
+def test_access_log_is_kept_by_default():
+    assert production_options(APIBaseSettings())["access_log"] is True
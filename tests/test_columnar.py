@@ -0,0 +1,55 @@
+import pytest
+
+from src.shared.columnar import PostBatch
+from src.shared.posts import Post
+
+POSTS = [
+    Post(id="a", platform="twitter", likes=10, shares=1, comments=2, timestamp=300.0),
+    Post(id="b", platform="twitter", likes=0, shares=0, comments=0, views=50),
+    Post(id="c", platform="tiktok", likes=4, shares=5, comments=6, timestamp=100.0),
+]
+
+
+@pytest.fixture
+def batch():
+    return PostBatch.from_posts(POSTS)
+
+
+def test_from_records_matches_from_posts(batch):
+    records = PostBatch.from_records(post.to_dict() for post in POSTS)
+
+    assert records.totals() == batch.totals() == {"likes": 14, "shares": 6, "views": 50, "comments": 8}
+    assert records.time_range() == batch.time_range() == {"start": 100.0, "end": 300.0}
+
+
+def test_from_records_defaults_missing_counters():
+    batch = PostBatch.from_records([{"id": "a", "likes": None}])
+
+    assert batch.totals() == {"likes": 0, "shares": 0, "views": 0, "comments": 0}
+    assert batch.time_range() == {"start": None, "end": None}
+
+
+def test_top_k(batch):
+    assert batch.top_k("engagement", 2) == [2, 0]
+    assert batch.top_k("views", 5)[0] == 1
+    assert batch.top_k("likes", 0) == []
+
+
+def test_unknown_metric(batch):
+    with pytest.raises(ValueError):
+        batch.column("followers")
+
+
+def test_percentiles(batch):
+    assert batch.percentiles("likes", q=(50,)) == {"p50": 4.0}
+    assert PostBatch.from_posts([]).percentiles("likes", q=(50,)) == {"p50": 0.0}
+
+
+def test_sentiments(batch):
+    assert batch.mean_sentiment() is None
+
+    batch.with_sentiments({"a": 1.0, "c": -1.0})
+
+    assert batch.mean_sentiment() == 0.0
+    # Weighted by engagement + 1: a weighs 14, c weighs 16
+    assert batch.weighted_sentiment() == pytest.approx((14 - 16) / 30)
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.shared import utils
+from src.shared.posts import Post
+
+pytestmark = pytest.mark.anyio
+
+POSTS = [Post(id="1", platform="twitter", likes=1), Post(id="2", platform="twitter", likes=2)]
+
+
+class FakeCollection:
+    def __init__(self, upserted_ids=None, modified_count=0):
+        self.result = SimpleNamespace(
+            upserted_ids=upserted_ids or {}, upserted_count=len(upserted_ids or {}), modified_count=modified_count
+        )
+        self.operations = []
+        self.updates = []
+
+    async def bulk_write(self, operations, ordered):
+        self.operations.extend(operations)
+        return self.result
+
+    async def update_many(self, query, update):
+        self.updates.append((query, update))
+
+
+@pytest.fixture
+def ingest(monkeypatch):
+    recorded = []
+
+    async def record(platform, keyword, posts):
+        recorded.extend(posts)
+
+    async def index(platform, keyword, posts):
+        pass
+
+    def install(posts_collection):
+        projects = FakeCollection()
+        monkeypatch.setattr(
+            utils.models.platform_models["twitter"], "get_motor_collection", staticmethod(lambda: posts_collection)
+        )
+        monkeypatch.setattr(utils.models.Project, "get_motor_collection", staticmethod(lambda: projects))
+        monkeypatch.setattr(utils, "record_sketches", record)
+        monkeypatch.setattr(utils, "index_terms", index)
+        return projects, recorded
+
+    return install
+
+
+async def test_new_posts_bump_data_version(ingest):
+    projects, recorded = ingest(FakeCollection(upserted_ids={1: "id"}))
+
+    await utils.ingest_posts("twitter", "Keyword", POSTS)
+
+    assert recorded == [POSTS[1]]
+    assert projects.updates == [({"slug": "keyword"}, {"$inc": {"data_version": 1}})]
+
+
+async def test_refreshed_posts_bump_data_version(ingest):
+    projects, recorded = ingest(FakeCollection(modified_count=2))
+
+    await utils.ingest_posts("twitter", "Keyword", POSTS)
+
+    assert recorded == []
+    assert projects.updates == [({"slug": "keyword"}, {"$inc": {"data_version": 1}})]
+
+
+async def test_unchanged_posts_keep_data_version(ingest):
+    projects, _ = ingest(FakeCollection())
+
+    await utils.ingest_posts("twitter", "Keyword", POSTS)
+
+    assert projects.updates == []
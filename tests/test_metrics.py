@@ -0,0 +1,48 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import BackgroundTasks, FastAPI
+
+from src.shared.metrics import REQUEST_DURATION, setup_metrics
+
+pytestmark = pytest.mark.anyio
+
+BACKGROUND_DELAY = 0.3
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    setup_metrics(app)
+
+    async def slow_task():
+        await asyncio.sleep(BACKGROUND_DELAY)
+
+    @app.get("/metrics-test/background")
+    async def background(bg: BackgroundTasks):
+        bg.add_task(slow_task)
+        return {"ok": True}
+
+    return app
+
+
+async def test_request_duration_excludes_background_tasks(app):
+    labels = ("GET", "/metrics-test/background", "200")
+    REQUEST_DURATION._values.pop(labels, None)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/metrics-test/background")
+
+    assert response.status_code == 200
+    counts, total = REQUEST_DURATION._values[labels]
+    assert sum(counts) == 1
+    assert total[0] < BACKGROUND_DELAY
+
+
+async def test_metrics_route(app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/@metrics")
+
+    assert response.status_code == 200
+    assert "yimba_http_request_duration_seconds" in response.text
@@ -0,0 +1,78 @@
+import pytest
+
+from src.common.helpers.exceptions import CustomHTTException
+from src.shared.auth_handler import CheckPermissions, user_permissions
+from src.shared.url_patterns import CHECK_ACCESS_ALLOW_URL, CHECK_USERINFO_URL
+
+pytestmark = pytest.mark.anyio
+
+AUTHORIZATION = "Bearer opaque-token"
+PERMISSION = "facebook:can-extract-data-from-facebook-posts"
+
+
+async def test_remote_grant_allows(auth_service):
+    auth_service(access={"access": True})
+
+    userinfo = await CheckPermissions([PERMISSION])(AUTHORIZATION)
+
+    assert userinfo["user_info"]["_id"] == "remote-user"
+
+
+@pytest.mark.parametrize("access", [{"access": False}, {}, {"access": "true"}, ["access"]])
+async def test_remote_success_without_explicit_grant_denies(auth_service, access):
+    auth_service(access=access)
+
+    with pytest.raises(CustomHTTException):
+        await CheckPermissions([PERMISSION])(AUTHORIZATION)
+
+
+async def test_remote_forbidden_denies(auth_service):
+    auth_service(status_code=403, access={"detail": "forbidden"})
+
+    with pytest.raises(CustomHTTException):
+        await CheckPermissions([PERMISSION])(AUTHORIZATION)
+
+
+async def test_remote_invalid_body_denies_without_caching(auth_service):
+    auth_service(content=b"<html>")
+
+    with pytest.raises(CustomHTTException):
+        await CheckPermissions([PERMISSION])(AUTHORIZATION)
+    assert len(CheckPermissions.decisions) == 0
+
+
+async def test_remote_decisions_are_cached(auth_service):
+    service = auth_service(access={"access": False})
+    check = CheckPermissions([PERMISSION])
+
+    for _ in range(3):
+        with pytest.raises(CustomHTTException):
+            await check(AUTHORIZATION)
+
+    assert service.calls[CHECK_ACCESS_ALLOW_URL] == 1
+    assert service.calls[CHECK_USERINFO_URL] == 1
+
+
+async def test_decisions_are_cached_per_permission_set(auth_service):
+    service = auth_service()
+
+    await CheckPermissions([PERMISSION])(AUTHORIZATION)
+    await CheckPermissions(["facebook:can-read-scrapper-facebook-data-statistics"])(AUTHORIZATION)
+
+    assert service.calls[CHECK_ACCESS_ALLOW_URL] == 2
+
+
+async def test_permissions_in_userinfo_skip_remote_check(auth_service):
+    service = auth_service(userinfo={"active": True, "user_info": {"_id": "user-1", "permissions": [PERMISSION]}})
+
+    await CheckPermissions([PERMISSION])(AUTHORIZATION)
+    with pytest.raises(CustomHTTException):
+        await CheckPermissions(["rapport:can-generate-report"])(AUTHORIZATION)
+
+    assert service.calls[CHECK_ACCESS_ALLOW_URL] == 0
+
+
+def test_user_permissions_claim_shapes():
+    assert user_permissions({"permissions": ["a", {"code": "b"}]}) == frozenset({"a", "b"})
+    assert user_permissions({"user_info": {"permissions": ["c"]}}) == frozenset({"c"})
+    assert user_permissions({"user_info": {}}) is None
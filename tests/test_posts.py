@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.shared.posts import flatten, normalize
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+
+
+def test_normalize_facebook():
+    [post] = normalize(
+        "facebook",
+        [
+            {
+                "postId": 123,
+                "user": {"name": "page"},
+                "text": "Hello",
+                "time": "2024-01-01T00:00:00Z",
+                "likesCount": "12",
+                "sharesCount": None,
+                "hashtags": ["#Vote"],
+            }
+        ],
+    )
+
+    assert (post.id, post.author, post.timestamp) == ("123", "page", EPOCH)
+    assert (post.likes, post.shares, post.hashtags) == (12, 0, ("vote",))
+
+
+def test_normalize_twitter():
+    [post] = normalize(
+        "twitter",
+        [
+            {
+                "id_str": "42",
+                "user": {"screen_name": "handle"},
+                "full_text": "Tweet",
+                "created_at": "Mon Jan 01 00:00:00 +0000 2024",
+                "favorite_count": 5,
+                "retweet_count": True,
+                "entities": {"hashtags": [{"text": "Music"}]},
+            }
+        ],
+    )
+
+    assert (post.id, post.author, post.text, post.timestamp) == ("42", "handle", "Tweet", EPOCH)
+    assert (post.likes, post.shares, post.hashtags) == (5, 0, ("music",))
+
+
+def test_normalize_tiktok_epoch_milliseconds():
+    [post] = normalize("tiktok", [{"id": 7, "createTime": EPOCH * 1000, "hashtags": [{"name": "Fyp"}]}])
+
+    assert (post.id, post.timestamp, post.hashtags) == ("7", EPOCH, ("fyp",))
+
+
+def test_normalize_nested_platforms():
+    instagram = [{"topPosts": [{"id": "1", "caption": "top"}], "latestPosts": [{"id": "2"}, {"caption": "no id"}]}]
+    google = [{"organicResults": [{"url": "https://example.com", "title": "Title", "description": "Text"}]}]
+
+    assert [post.id for post in normalize("instagram", instagram)] == ["1", "2"]
+    assert [post.text for post in normalize("google", google)] == ["Title Text"]
+
+
+def test_flatten_keeps_flat_platforms():
+    items = [{"id": "1"}, {"id": "2"}]
+
+    assert flatten("facebook", items) == items
+    assert flatten("instagram", [{"topPosts": None, "latestPosts": [{"id": "3"}]}]) == [{"id": "3"}]
+
+
+def test_normalize_unknown_platform():
+    with pytest.raises(ValueError):
+        normalize("myspace", [])
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from src.shared import projects
+from src.shared.error_codes import YimbaApifyErrorCode
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+class FakeProjectCollection:
+    def __init__(self, docs=()):
+        self.docs = list(docs)
+        self.queries = []
+
+    def find(self, query, *args, **kwargs):
+        self.queries.append(query)
+        if isinstance(slug := query.get("slug"), dict):
+            return FakeCursor([doc for doc in self.docs if doc["slug"] in slug["$in"]])
+        return FakeCursor(self.docs)
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake = FakeProjectCollection([{"_id": "p1", "name": "Red cup", "slug": "red-cup"}])
+    monkeypatch.setattr(projects.models.Project, "get_motor_collection", staticmethod(lambda: fake))
+    return fake
+
+
+@pytest.mark.parametrize("user", [None, ""])
+async def test_suggest_projects_requires_user(collection, user):
+    assert await projects.suggest_projects("red", user=user) == []
+    assert collection.queries == []
+
+
+async def test_suggest_projects_filters_on_user(collection):
+    suggestions = await projects.suggest_projects("Red C", user="user-1")
+
+    assert [suggestion.slug for suggestion in suggestions] == ["red-cup"]
+    assert collection.queries == [{"search_terms": "red-c", "user._id": "user-1"}]
+
+
+@pytest.mark.parametrize(
+    "data, filename",
+    [
+        (b"name\nRed cup\n\n Blue sky \n", "projects.csv"),
+        (json.dumps(["Red cup", {"name": " Blue sky "}, ""]).encode(), "projects.json"),
+    ],
+)
+def test_read_names(data, filename):
+    assert projects.read_names(data, filename=filename) == ["Red cup", "Blue sky"]
+
+
+@pytest.mark.parametrize("items", [[None, 3], ["Red cup", {"name": 3}], {"name": "Red cup"}])
+def test_read_names_rejects_invalid_json_items(items):
+    with pytest.raises(ValueError):
+        projects.read_names(json.dumps(items).encode(), content_type="application/json")
+
+
+async def test_prepare_projects_reports_invalid_names(collection):
+    documents, errors = await projects.prepare_projects(["Red cup", "!!!", "red-cup", "Blue sky"], {"_id": "user-1"})
+
+    assert [document.slug for document in documents] == ["blue-sky"]
+    assert [(error.name, error.code) for error in errors] == [
+        ("!!!", YimbaApifyErrorCode.VALUE_ERROR),
+        ("red-cup", YimbaApifyErrorCode.PARAMETER_CONFLICT),
+        ("Red cup", YimbaApifyErrorCode.DOCUMENT_ALREADY_EXISTS),
+    ]
+
+
+async def test_insert_projects_reports_failed_items(collection, monkeypatch):
+    documents, _ = await projects.prepare_projects(["One", "Two", "Three"], {"_id": "user-1"})
+
+    async def insert_many(batch, ordered):
+        raise BulkWriteError({"writeErrors": [{"index": 1, "code": projects.DUPLICATE_KEY}]})
+
+    monkeypatch.setattr(projects.models.Project, "insert_many", insert_many)
+    created, errors = await projects.insert_projects(documents)
+
+    assert [project.slug for project in created] == ["one", "three"]
+    assert [(error.name, error.code) for error in errors] == [("Two", YimbaApifyErrorCode.DOCUMENT_ALREADY_EXISTS)]
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.shared.render import cache_headers, RenderPool
+
+pytestmark = pytest.mark.anyio
+
+released = threading.Event()
+
+
+def slow_render(text: str) -> bytes:
+    released.wait(timeout=5)
+    return text.encode("utf-8")
+
+
+@pytest.fixture
+def pool():
+    released.clear()
+    render_pool = RenderPool(workers=1, cache_size=8)
+    render_pool._executor = ThreadPoolExecutor(max_workers=1)
+    yield render_pool
+    released.set()
+    render_pool.shutdown()
+
+
+async def test_cancelled_caller_does_not_cancel_shared_render(pool):
+    first = asyncio.create_task(pool.render(slow_render, text="cloud"))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(pool.render(slow_render, text="cloud"))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+    released.set()
+
+    key, image = await second
+    assert image == b"cloud"
+    assert first.cancelled()
+    assert pool.cache.get(key) == b"cloud"
+    assert not pool._pending
+
+
+async def test_render_is_cached_when_its_caller_is_cancelled(pool):
+    task = asyncio.create_task(pool.render(slow_render, text="cloud"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    released.set()
+    await asyncio.sleep(0.05)
+
+    assert pool.cache.get(pool.key(slow_render, text="cloud")) == b"cloud"
+
+
+def test_images_are_only_cached_privately():
+    headers = cache_headers("etag")
+
+    assert headers["ETag"] == '"etag"'
+    assert headers["Cache-Control"].startswith("private, max-age=")
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from src.shared import report
+from src.shared.templating import templates
+
+pytestmark = pytest.mark.anyio
+
+TOTALS = {"likes": 3, "shares": 2, "views": 10, "comments": 1}
+
+
+@pytest.fixture
+def sections(monkeypatch):
+    calls = []
+
+    async def platform_totals(platform, keyword):
+        calls.append(platform)
+        await asyncio.sleep(0)
+        return TOTALS
+
+    async def render(func, **kwargs):
+        return "key", b"png"
+
+    async def no_data(keyword, totals):
+        return {}
+
+    monkeypatch.setattr(report, "platform_totals", platform_totals)
+    monkeypatch.setattr(report.pool, "render", render)
+    monkeypatch.setattr(report, "process_text_facebook", no_data)
+    monkeypatch.setattr(report, "generate_cloud_tags_facebook", no_data)
+    monkeypatch.setattr(
+        report,
+        "SECTIONS",
+        tuple(getattr(report, section.__name__) for section in report.SECTIONS),
+    )
+    return calls
+
+
+async def test_platform_totals_are_aggregated_once_per_report(sections):
+    context = await report.build_report_context("keyword")
+
+    assert sorted(sections) == ["facebook", "instagram", "tiktok", "youtube"]
+    assert context["fb_total_likes_count"] == 3
+    assert context["fb_graphic_img"].startswith("data:image/png;base64,")
+    assert context["missing_sections"] == []
+
+
+async def test_section_timeout_does_not_cancel_shared_totals(sections, monkeypatch):
+    async def slow_graphic(keyword, totals):
+        await totals.get("facebook")
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(report, "SECTIONS", (slow_graphic, report.get_fb_analyse))
+
+    context = await report.build_report_context("keyword", timeout=0.05)
+
+    assert context["missing_sections"] == ["slow_graphic"]
+    assert context["fb_total_views_count"] == 10
+
+
+def test_report_lists_missing_sections_and_skips_empty_images():
+    html = templates.render_report({"page_title": "KEYWORD", "missing_sections": ["fb_graphic"]})
+
+    assert "Graphique Facebook" in html
+    assert '<img src=""' not in html
@@ -0,0 +1,148 @@
+import pytest
+
+from src.shared import audience
+from src.shared.posts import Post
+from src.shared.sketches import CountMinSketch, extract_hashtags, extract_mentions, HeavyHitters, HyperLogLog
+
+
+def test_hyperloglog_merge_counts_union():
+    left, right = HyperLogLog(), HyperLogLog()
+    left.update(f"user-{index}" for index in range(0, 3000))
+    right.update(f"user-{index}" for index in range(2000, 5000))
+
+    merged = HyperLogLog(registers=left.to_bytes()).merge(right)
+
+    assert merged.count() == pytest.approx(5000, rel=0.05)
+    assert left.count() == pytest.approx(3000, rel=0.05)
+
+
+def test_hyperloglog_rejects_other_precision():
+    with pytest.raises(ValueError):
+        HyperLogLog().merge(HyperLogLog(precision=10))
+
+
+def test_count_min_merge_adds_frequencies():
+    left, right = CountMinSketch(), CountMinSketch()
+    left.add("election", 3)
+    right.add("election", 2)
+    right.add("music")
+
+    left.merge(CountMinSketch(table=right.to_bytes()))
+
+    assert left.estimate("election") >= 5
+    assert left.estimate("music") >= 1
+    assert left.estimate("election") - 5 <= 1
+
+
+def test_heavy_hitters_merge_keeps_top_items():
+    left, right = HeavyHitters(capacity=2), HeavyHitters(capacity=2)
+    left.update(["a"] * 5 + ["b"] * 3 + ["c"])
+    right.update(["b"] * 4 + ["c"] * 2 + ["d"])
+
+    left.merge(right)
+
+    assert left.top(2) == [("b", 7), ("a", 5)]
+    assert len(left.candidates) == 2
+
+
+@pytest.mark.parametrize(
+    "text, mentions",
+    [
+        ("Thanks @john.doe.", ["john.doe"]),
+        ("@Alice, @bob_2 and @carol...", ["alice", "bob_2", "carol"]),
+        ("mail me at someone@example.com", []),
+        ("@x is too short", []),
+        ("", []),
+    ],
+)
+def test_extract_mentions(text, mentions):
+    assert extract_mentions(text) == mentions
+
+
+def test_extract_hashtags():
+    assert extract_hashtags("#Vote for #2024 and not for a#b #x") == ["vote", "2024"]
+
+
+class FakeSketchCollection:
+    """
+    Single document collection; `concurrent_writes` updates bump the version between read and write.
+    """
+
+    def __init__(self, concurrent_writes: int = 0):
+        self.doc = None
+        self.concurrent_writes = concurrent_writes
+
+    async def find_one(self, query):
+        return dict(self.doc) if self.doc is not None else None
+
+    async def insert_one(self, doc):
+        self.doc = {**doc, "_id": 1}
+
+    async def update_one(self, query, update):
+        if self.concurrent_writes:
+            self.concurrent_writes -= 1
+            self.doc["version"] += 1
+
+        class Result:
+            modified_count = 0
+
+        if self.doc["version"] == query["version"]:
+            self.doc.update(update["$set"])
+            self.doc["version"] += update["$inc"]["version"]
+            Result.modified_count = 1
+        return Result
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    def install(**kwargs):
+        fake = FakeSketchCollection(**kwargs)
+        monkeypatch.setattr(audience.models.Sketch, "get_motor_collection", lambda: fake)
+        return fake
+
+    return install
+
+
+def _posts(*authors):
+    return [Post(id=author, platform="twitter", author=author, text=f"@{author}", timestamp=0) for author in authors]
+
+
+@pytest.mark.anyio
+async def test_record_sketches_retries_on_concurrent_update(collection):
+    fake = collection(concurrent_writes=2)
+
+    await audience.record_sketches("twitter", "keyword", _posts("alice"))
+    await audience.record_sketches("twitter", "keyword", _posts("bob", "carol"))
+
+    assert fake.doc["version"] == 4
+    assert {"term": "alice", "count": 1} in fake.doc["mention_candidates"]
+    authors, _, mentions = audience._load(fake.doc)
+    assert authors.count() == 3
+    assert dict(mentions.top()) == {"alice": 1, "bob": 1, "carol": 1}
+
+
+@pytest.mark.anyio
+async def test_record_sketches_gives_up_after_attempts(collection):
+    fake = collection(concurrent_writes=audience.SKETCH_UPDATE_ATTEMPTS + 1)
+
+    await audience.record_sketches("twitter", "keyword", _posts("alice"))
+    await audience.record_sketches("twitter", "keyword", _posts("bob"))
+
+    authors, _, _ = audience._load(fake.doc)
+    assert authors.count() == 1
+
+
+def test_sketches_store_dotted_handles_as_pairs():
+    doc = {
+        "authors": HyperLogLog().to_bytes(),
+        "hashtags": CountMinSketch().to_bytes(),
+        "mentions": CountMinSketch().to_bytes(),
+        "hashtag_candidates": {"vote": 2},
+        "mention_candidates": [{"term": "john.doe", "count": 3}],
+    }
+
+    _, hashtags, mentions = audience._load(doc)
+
+    assert hashtags.candidates == {"vote": 2}
+    assert mentions.candidates == {"john.doe": 3}
+    assert audience._dump_candidates(mentions.candidates) == [{"term": "john.doe", "count": 3}]
@@ -0,0 +1,25 @@
+from src.shared.text import edge_ngrams, term_frequencies, tokenize
+
+
+def test_edge_ngrams_cover_slug_and_word_prefixes():
+    assert edge_ngrams("red-cup") == ["c", "cu", "cup", "r", "re", "red", "red-", "red-c", "red-cu", "red-cup"]
+
+
+def test_edge_ngrams_are_bounded():
+    grams = edge_ngrams("presidential-election", min_size=2, max_size=4)
+
+    assert grams == ["el", "ele", "elec", "pr", "pre", "pres"]
+
+
+def test_tokenize_drops_stopwords_urls_and_mentions():
+    text = "Le MATCH de @john.doe. était GÉNIAL! https://t.co/x the match’s fans, 2024 ok"
+
+    assert tokenize(text) == ["match", "génial", "match's", "fans"]
+
+
+def test_tokenize_empty():
+    assert tokenize("") == []
+
+
+def test_term_frequencies():
+    assert term_frequencies(["vote vote", "Vote city"]) == {"vote": 3, "city": 1}
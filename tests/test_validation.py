@@ -0,0 +1,47 @@
+import logging
+from datetime import date
+
+from pydantic import BaseModel
+
+from src.shared.validation import BatchValidator
+
+
+class Item(BaseModel):
+    id: str
+    likes: int = 0
+    day: date | None = None
+
+
+validator = BatchValidator("items", Item)
+
+
+def test_validate_drops_and_reports_invalid_items():
+    valid, errors = validator.validate([{"id": "a"}, {"likes": 1}, {"id": "c", "likes": "many"}, {"id": "d"}])
+
+    assert [item.id for item in valid] == ["a", "d"]
+    assert [error.index for error in errors] == [1, 2]
+    assert errors[0].errors[0]["loc"] == ("id",)
+    assert errors[1].errors[0]["loc"] == ("likes",)
+    assert "input" not in errors[0].errors[0]
+
+
+def test_validate_reports_items_that_are_not_objects():
+    valid, errors = validator.validate([None, {"id": "b"}])
+
+    assert [item.id for item in valid] == ["b"]
+    assert [(error.index, error.errors[0]["loc"]) for error in errors] == [(0, ())]
+
+
+def test_clean_dumps_valid_items_as_json(caplog):
+    with caplog.at_level(logging.WARNING):
+        items = validator.clean([{"id": "a", "day": "2024-01-01"}, {"id": None}])
+
+    assert items == [{"id": "a", "likes": 0, "day": "2024-01-01"}]
+    assert "Dropped 1/2 invalid items items, first at index 1" in caplog.text
+
+
+def test_clean_without_errors_does_not_warn(caplog):
+    with caplog.at_level(logging.WARNING):
+        assert validator.clean([]) == []
+
+    assert caplog.text == ""